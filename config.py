@@ -1,11 +1,48 @@
 import functools
-from typing import Dict
+import os
+import pickle
+from typing import Dict, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore
+
+_CONFIG_PATH = "config.yml"
+# Parsed config, keyed on the mtime of config.yml so edits invalidate it
+_CONFIG_CACHE_PATH = "config.yml.pkl"
+
+
+def _load_cached_config(mtime_ns: int) -> Optional[Dict]:
+    try:
+        with open(_CONFIG_CACHE_PATH, "rb") as f:
+            cached_mtime_ns, d = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+    return d if cached_mtime_ns == mtime_ns else None
+
+
+def _store_cached_config(mtime_ns: int, d: Dict) -> None:
+    # Write then rename, so concurrent processes never read a partial cache
+    tmp_path = f"{_CONFIG_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((mtime_ns, d), f)
+        os.replace(tmp_path, _CONFIG_CACHE_PATH)
+    except OSError:
+        # The cache is best effort only, e.g. the directory may be read-only
+        pass
+
 
 @functools.lru_cache(1)
 def load_config() -> Dict:
-    with open("config.yml", "r") as ymlfile:
-        d: Dict = yaml.safe_load(ymlfile)
-        return d
+    mtime_ns = os.stat(_CONFIG_PATH).st_mtime_ns
+    if (cached := _load_cached_config(mtime_ns)) is not None:
+        return cached
+    # libyaml decodes the bytes itself, so skip the text layer
+    with open(_CONFIG_PATH, "rb") as ymlfile:
+        d: Dict = yaml.load(ymlfile, Loader=SafeLoader)
+    _store_cached_config(mtime_ns, d)
+    return d
@@ -1,17 +1,27 @@
 import logging
 import logging.config
 import multiprocessing
+import sys
+
+import multiprocess
 
 from config import load_config
 from sporkfish.runner import RunConfig, Runner
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+    # Fork worker processes (e.g. the lazy SMP pool) on Linux, so they inherit the modules imported above
+    # rather than re-importing them on every start as spawn and forkserver do.
+    # pathos pools use multiprocess, so its start method needs setting too.
+    if sys.platform == "linux":
+        multiprocessing.set_start_method("fork", force=True)
+        multiprocess.set_start_method("fork", force=True)
+
     config = load_config()
 
     logging_config = config.get("LoggingConfig")
 
-    multiprocessing.freeze_support()
-
     logging.config.dictConfig(logging_config)
 
     logging.info("----- Sporkfish -----")
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
 import chess
+import numpy as np
 
 
 class Board(ABC):
@@ -55,14 +56,25 @@ class Board(ABC):
         pass
 
     @abstractmethod
-    def set_epd(self, epd: str) -> Dict[str, Any]:
+    def set_epd(self, epd: str) -> Mapping[str, Any]:
         """
         Set the position based on the input EPD string.
 
         :param epd: EPD string.
         :type epd: str
         :return: The epd info (e.g. containing best move) for the board.
-        :rtype: Dict[str, Any]
+        :rtype: Mapping[str, Any]
+        """
+        pass
+
+    @abstractmethod
+    def clone(self) -> "Board":
+        """
+        Create an independent copy of the board in its current position.
+        The copy does not share the move history, so moves made before cloning cannot be popped.
+
+        :return: A copy of the board.
+        :rtype: Board
         """
         pass
 
@@ -89,6 +101,17 @@ class Board(ABC):
         """
         pass
 
+    @property
+    @abstractmethod
+    def zobrist_hash(self) -> int:
+        """
+        Get the Zobrist hash of the current position.
+
+        :return: The Zobrist hash.
+        :rtype: int
+        """
+        pass
+
     @property
     @abstractmethod
     # NB: this returns any because we don't have a set type for legal moves in our own board implementation.
@@ -102,6 +125,67 @@ class Board(ABC):
         """
         pass
 
+    @property
+    @abstractmethod
+    def legal_captures(self) -> Any:
+        """
+        Get a collection of all legal captures (including en passant) for the current position.
+
+        :return: A collection of legal captures.
+        :rtype: Any
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def occupied(self) -> chess.Bitboard:
+        """
+        Get the bitboard of all occupied squares.
+
+        :return: A 64-bit mask with a bit set for every occupied square.
+        :rtype: chess.Bitboard
+        """
+        pass
+
+    @abstractmethod
+    def occupied_co(self, color: chess.Color) -> chess.Bitboard:
+        """
+        Get the bitboard of squares occupied by the given color.
+
+        :param color: The color to get the occupancy of.
+        :type color: chess.Color
+        :return: A 64-bit mask with a bit set for every square occupied by the color.
+        :rtype: chess.Bitboard
+        """
+        pass
+
+    @abstractmethod
+    def pieces_mask(
+        self, piece_type: chess.PieceType, color: chess.Color
+    ) -> chess.Bitboard:
+        """
+        Get the bitboard of all pieces of the given type and color.
+
+        :param piece_type: The piece type.
+        :type piece_type: chess.PieceType
+        :param color: The piece color.
+        :type color: chess.Color
+        :return: A 64-bit mask with a bit set for every square holding such a piece.
+        :rtype: chess.Bitboard
+        """
+        pass
+
+    @abstractmethod
+    def piece_array(self) -> np.ndarray:
+        """
+        Get the pieces of the board as an int8 array indexed by square.
+        Each entry is the piece type, negated for black pieces, or 0 for an empty square.
+
+        :return: An array of 64 signed piece codes.
+        :rtype: np.ndarray
+        """
+        pass
+
     @abstractmethod
     def piece_at(self, square: chess.Square) -> Optional[chess.Piece]:
         """
@@ -114,6 +198,18 @@ class Board(ABC):
         """
         pass
 
+    @abstractmethod
+    def piece_type_at(self, square: chess.Square) -> Optional[chess.PieceType]:
+        """
+        Get the type of the piece at the specified square, without building a piece object.
+
+        :param square: The target square.
+        :type square: Square
+        :return: The piece type at the specified square, or None if the square is empty.
+        :rtype: Optional[PieceType]
+        """
+        pass
+
     @abstractmethod
     def is_capture(self, move: chess.Move) -> bool:
         """
@@ -156,6 +252,18 @@ class Board(ABC):
         """
         pass
 
+    @abstractmethod
+    def uci(self, move: chess.Move) -> str:
+        """
+        Get the Universal Chess Interface (UCI) notation of a move.
+
+        :param move: The move to convert.
+        :type move: chess.Move
+        :return: UCI-formatted move string, "0000" for the null move.
+        :rtype: str
+        """
+        pass
+
     @abstractmethod
     def has_queenside_castling_rights(self, color: chess.Color) -> bool:
         """
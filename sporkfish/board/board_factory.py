@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Callable, Dict, Type
 
 from sporkfish.board.board import Board
 from sporkfish.board.board_py_chess import BoardPyChess
@@ -9,6 +9,24 @@ class BoardFactory:
     Factory class for creating instances of different board types.
     """
 
+    # Constructor for each supported board type, looked up directly rather than branching on the type
+    _REGISTRY: Dict[Type[Board], Callable[[], Board]] = {
+        BoardPyChess: BoardPyChess,
+    }
+
+    @staticmethod
+    def register(board_type: Type[Board], constructor: Callable[[], Board]) -> None:
+        """
+        Register a board type with the factory, so that boards backed by optional modules
+        only need importing when they are used. An existing registration is kept.
+
+        :param board_type: The type of the board to register.
+        :type board_type: Type[Board]
+        :param constructor: Callable creating a new board of that type.
+        :type constructor: Callable[[], Board]
+        """
+        BoardFactory._REGISTRY.setdefault(board_type, constructor)
+
     @staticmethod
     def create(board_type: Type) -> Board:
         """
@@ -20,9 +38,11 @@ class BoardFactory:
         :rtype: Board
         :raises TypeError: If the specified board type is not supported by BoardFactory.
         """
-        if board_type is BoardPyChess:
-            return BoardPyChess()
-        raise TypeError(
-            f"BoardFactory does not support the creation of board type \
-                        {type(board_type).__name__}."
-        )
+        try:
+            constructor = BoardFactory._REGISTRY[board_type]
+        except (KeyError, TypeError):
+            raise TypeError(
+                f"BoardFactory does not support the creation of board type \
+                        {getattr(board_type, '__name__', type(board_type).__name__)}."
+            ) from None
+        return constructor()
@@ -1,8 +1,103 @@
-from typing import Any, Dict, Optional
+import sys
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, final
 
 import chess
+import numpy as np
 
 from sporkfish.board.board import Board
+from sporkfish.zobrist_hasher import (
+    CASTLING_KEYS,
+    EN_PASSANT_KEYS,
+    PIECE_KEYS,
+    TURN_KEY,
+)
+
+
+# python-chess allocates a new Piece on every piece_at call, but there are only 12 distinct pieces.
+# Hand out shared instances instead, indexed by [color][piece_type].
+_PIECES: Tuple[Tuple[Optional[chess.Piece], ...], ...] = tuple(
+    (None, *(chess.Piece(piece_type, color) for piece_type in chess.PIECE_TYPES))
+    for color in (chess.BLACK, chess.WHITE)
+)
+
+
+# O(1) lookups for UCI parsing, python-chess scans SQUARE_NAMES and PIECE_SYMBOLS with list.index.
+_SQUARE_INDEX: Dict[str, chess.Square] = {
+    name: square for square, name in enumerate(chess.SQUARE_NAMES)
+}
+_PROMOTION_INDEX: Dict[str, chess.PieceType] = {
+    chess.piece_symbol(piece_type): piece_type
+    for piece_type in (chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN)
+}
+# And the reverse, UCI strings of every (from_square, to_square) pair built once
+_UCI_NAMES: List[List[str]] = [
+    [sys.intern(from_name + to_name) for to_name in chess.SQUARE_NAMES]
+    for from_name in chess.SQUARE_NAMES
+]
+
+
+# Cached state of a position kept on the move stack:
+# legal moves, legal captures, piece array, squares changed by the last move, check status,
+# Zobrist hash and castling index
+_PositionState = Tuple[
+    Optional[List[chess.Move]],
+    Optional[List[chess.Move]],
+    Optional[np.ndarray],
+    chess.Bitboard,
+    Optional[bool],
+    int,
+    int,
+]
+
+
+def _move_from_uci(uci: str) -> Optional[chess.Move]:
+    # Parses the common case of a normal or promotion move,
+    # returns None for anything else (null moves, drops, malformed strings)
+    try:
+        from_square = _SQUARE_INDEX[uci[0:2]]
+        to_square = _SQUARE_INDEX[uci[2:4]]
+        promotion = _PROMOTION_INDEX[uci[4]] if len(uci) == 5 else None
+    except KeyError:
+        return None
+    if len(uci) > 5 or from_square == to_square:
+        return None
+    return chess.Move(from_square, to_square, promotion)
+
+
+class _LazyEpdInfo(Mapping[str, Any]):
+    """
+    The operations of an EPD string (e.g. best move, id), parsed by python-chess on first access.
+    Most positions set from EPD are only searched, so the operations are never read.
+    """
+
+    def __init__(self, epd: str) -> None:
+        self._epd = epd
+        self._info: Optional[Dict[str, Any]] = None
+
+    def _parsed(self) -> Dict[str, Any]:
+        if self._info is None:
+            self._info = chess.Board().set_epd(self._epd)
+        return self._info
+
+    def __getitem__(self, opcode: str) -> Any:
+        return self._parsed()[opcode]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parsed())
+
+    def __len__(self) -> int:
+        return len(self._parsed())
+
+
+def _castling_index(board: chess.Board) -> int:
+    # Same encoding as ZobristHasher, one bit each for white kingside, white queenside,
+    # black kingside and black queenside rights
+    return (
+        board.has_kingside_castling_rights(chess.WHITE)
+        | board.has_queenside_castling_rights(chess.WHITE) << 1
+        | board.has_kingside_castling_rights(chess.BLACK) << 2
+        | board.has_queenside_castling_rights(chess.BLACK) << 3
+    )
 
 
 class BoardPyChess(Board):
@@ -15,8 +110,49 @@ class BoardPyChess(Board):
         Initialize a new chess board using the python-chess library.
         """
         self.board = chess.Board()
+        # Move lists, piece array and check status of the current position, generated lazily.
+        self._legal_moves: Optional[List[chess.Move]] = None
+        self._legal_captures: Optional[List[chess.Move]] = None
+        self._piece_array: Optional[np.ndarray] = None
+        self._is_check: Optional[bool] = None
+        # Squares whose piece changed with the last move, to derive the piece array from the parent position
+        self._changed_squares = chess.BB_EMPTY
+        # Zobrist hash of the current position, updated incrementally on push
+        self._zobrist_hash = 0
+        self._castling_index = 0
+        # State of the positions further up the move stack, restored on pop
+        self._stack: List[_PositionState] = []
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """
+        Recompute the cached state from scratch, after the position is set directly.
+        """
+        board = self.board
+        self._stack.clear()
+        self._legal_moves = self._legal_captures = None
+        self._piece_array = None
+        self._is_check = None
+        self._changed_squares = chess.BB_EMPTY
+
+        # Scan the bitboards rather than the piece map, which allocates and hashes a chess.Piece per square
+        zobrist_hash = 0
+        for piece_type in chess.PIECE_TYPES:
+            for color, piece_index in (
+                (chess.WHITE, piece_type - 1),
+                (chess.BLACK, piece_type + 5),
+            ):
+                for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                    zobrist_hash ^= PIECE_KEYS[square][piece_index]
+        if board.turn:
+            zobrist_hash ^= TURN_KEY
+        if board.ep_square is not None:
+            zobrist_hash ^= EN_PASSANT_KEYS[chess.square_file(board.ep_square)]
+        self._castling_index = _castling_index(board)
+        self._zobrist_hash = zobrist_hash ^ CASTLING_KEYS[self._castling_index]
 
     # --- Board mutators ---
+    @final
     def push(self, move: chess.Move) -> None:
         """
         Apply the given move to the board.
@@ -24,19 +160,90 @@ class BoardPyChess(Board):
         :param move: The move to be applied.
         :type move: chess.Move
         """
-        self.board.push(move)
-
+        board = self.board
+        pieces = (
+            board.pawns,
+            board.knights,
+            board.bishops,
+            board.rooks,
+            board.queens,
+            board.kings,
+        )
+        black, white = board.occupied_co
+        castling_rights = board.castling_rights
+        ep_square = board.ep_square
+
+        self._stack.append(
+            (
+                self._legal_moves,
+                self._legal_captures,
+                self._piece_array,
+                self._changed_squares,
+                self._is_check,
+                self._zobrist_hash,
+                self._castling_index,
+            )
+        )
+        self._legal_moves = self._legal_captures = None
+        self._piece_array = None
+        self._is_check = None
+        board.push(move)
+
+        zobrist_hash = self._zobrist_hash ^ TURN_KEY
+        new_black, new_white = board.occupied_co
+        # Any square whose piece changed (including captures, en passant, castling rooks
+        # and promotions) also changed occupancy for at least one color
+        changed_squares = (black ^ new_black) | (white ^ new_white)
+        self._changed_squares = changed_squares
+        for square in chess.scan_forward(changed_squares):
+            mask = chess.BB_SQUARES[square]
+            for piece_type, piece_mask in enumerate(pieces, chess.PAWN):
+                if piece_mask & mask:
+                    zobrist_hash ^= PIECE_KEYS[square][
+                        piece_type - 1 if white & mask else piece_type + 5
+                    ]
+                    break
+            if new_piece_type := board.piece_type_at(square):
+                zobrist_hash ^= PIECE_KEYS[square][
+                    new_piece_type - 1 if new_white & mask else new_piece_type + 5
+                ]
+
+        if ep_square is not None:
+            zobrist_hash ^= EN_PASSANT_KEYS[chess.square_file(ep_square)]
+        if board.ep_square is not None:
+            zobrist_hash ^= EN_PASSANT_KEYS[chess.square_file(board.ep_square)]
+
+        if board.castling_rights != castling_rights:
+            castling_index = _castling_index(board)
+            zobrist_hash ^= (
+                CASTLING_KEYS[self._castling_index] ^ CASTLING_KEYS[castling_index]
+            )
+            self._castling_index = castling_index
+
+        self._zobrist_hash = zobrist_hash
+
+    @final
     def pop(self) -> None:
         """
         Undo the last move on the board.
         """
         self.board.pop()
+        (
+            self._legal_moves,
+            self._legal_captures,
+            self._piece_array,
+            self._changed_squares,
+            self._is_check,
+            self._zobrist_hash,
+            self._castling_index,
+        ) = self._stack.pop()
 
     def reset(self) -> None:
         """
         Reset the board to its initial state.
         """
         self.board.reset()
+        self._reset_state()
 
     def push_uci(self, move: str) -> None:
         """
@@ -45,7 +252,33 @@ class BoardPyChess(Board):
         :param move: UCI-formatted move string.
         :type move: str
         """
-        self.board.push_uci(move)
+        parsed = _move_from_uci(move)
+        if parsed is None or not self.board.is_legal(parsed):
+            # Let python-chess handle null moves, Chess960 castling and errors
+            parsed = self.board.parse_uci(move)
+        self.push(parsed)
+
+    def clone(self) -> "BoardPyChess":
+        """
+        Create an independent copy of the board in its current position.
+        The copy does not share the move history, so moves made before cloning cannot be popped.
+        Much cheaper than a deepcopy, as the cached state of the position is immutable and shared.
+
+        :return: A copy of the board.
+        :rtype: BoardPyChess
+        """
+        # Bypass __init__, which would recompute the cached state from scratch
+        clone = BoardPyChess.__new__(BoardPyChess)
+        clone.board = self.board.copy(stack=False)
+        clone._legal_moves = self._legal_moves
+        clone._legal_captures = self._legal_captures
+        clone._piece_array = self._piece_array
+        clone._is_check = self._is_check
+        clone._changed_squares = self._changed_squares
+        clone._zobrist_hash = self._zobrist_hash
+        clone._castling_index = self._castling_index
+        clone._stack = []
+        return clone
 
     # --- Board information ---
     @property
@@ -66,17 +299,26 @@ class BoardPyChess(Board):
         :type fen: str
         """
         self.board.set_fen(fen)
+        self._reset_state()
 
-    def set_epd(self, epd: str) -> Dict[str, Any]:
+    def set_epd(self, epd: str) -> Mapping[str, Any]:
         """
         Set the position based on the input EPD string.
 
         :param epd: EPD string.
         :type epd: str
-        :return: The epd info (e.g. containing best move) for the board.
-        :rtype: Dict[str, Any]
-        """
-        return self.board.set_epd(epd)
+        :return: The epd info (e.g. containing best move) for the board, parsed lazily on first access.
+        :rtype: Mapping[str, Any]
+        """
+        parts = epd.strip().rstrip(";").split(None, 4)
+        # The half-move clock and full-move number operations change the position, so parse those eagerly
+        if len(parts) > 4 and "hmvc" not in parts[4] and "fmvn" not in parts[4]:
+            self.board.set_fen(" ".join(parts[:4]) + " 0 1")
+            self._reset_state()
+            return _LazyEpdInfo(epd)
+        epd_info = self.board.set_epd(epd)
+        self._reset_state()
+        return epd_info
 
     @property
     def ep_square(self) -> Optional[chess.Square]:
@@ -89,14 +331,125 @@ class BoardPyChess(Board):
         return self.board.ep_square
 
     @property
-    def legal_moves(self) -> Any:
+    def zobrist_hash(self) -> int:
+        """
+        Get the Zobrist hash of the current position, maintained incrementally as moves are pushed and popped.
+        It equals the hash computed from scratch by ZobristHasher.
+
+        :return: The Zobrist hash, as a signed 64-bit integer.
+        :rtype: int
+        """
+        return self._zobrist_hash
+
+    @property
+    def legal_moves(self) -> List[chess.Move]:
+        """
+        Get a list of all legal moves for the current position.
+        The list is generated once per position and shared between callers, so must not be modified.
+
+        :return: A list of legal moves.
+        :rtype: List[chess.Move]
+        """
+        if self._legal_moves is None:
+            self._legal_moves = list(self.board.generate_legal_moves())
+        return self._legal_moves
+
+    @property
+    def legal_captures(self) -> List[chess.Move]:
         """
-        Get a collection of all legal moves for the current position.
+        Get a list of all legal captures (including en passant) for the current position.
+        The list is generated once per position and shared between callers, so must not be modified.
 
-        :return: A collection of legal moves.
-        :rtype: Any
+        :return: A list of legal captures.
+        :rtype: List[chess.Move]
+        """
+        if self._legal_captures is None:
+            self._legal_captures = list(self.board.generate_legal_captures())
+        return self._legal_captures
+
+    @property
+    def occupied(self) -> chess.Bitboard:
         """
-        return self.board.legal_moves
+        Get the bitboard of all occupied squares.
+
+        :return: A 64-bit mask with a bit set for every occupied square.
+        :rtype: chess.Bitboard
+        """
+        return self.board.occupied
+
+    def occupied_co(self, color: chess.Color) -> chess.Bitboard:
+        """
+        Get the bitboard of squares occupied by the given color.
+
+        :param color: The color to get the occupancy of.
+        :type color: chess.Color
+        :return: A 64-bit mask with a bit set for every square occupied by the color.
+        :rtype: chess.Bitboard
+        """
+        return self.board.occupied_co[color]
+
+    def pieces_mask(
+        self, piece_type: chess.PieceType, color: chess.Color
+    ) -> chess.Bitboard:
+        """
+        Get the bitboard of all pieces of the given type and color.
+
+        :param piece_type: The piece type.
+        :type piece_type: chess.PieceType
+        :param color: The piece color.
+        :type color: chess.Color
+        :return: A 64-bit mask with a bit set for every square holding such a piece.
+        :rtype: chess.Bitboard
+        """
+        return self.board.pieces_mask(piece_type, color)
+
+    @final
+    def piece_array(self) -> np.ndarray:
+        """
+        Get the pieces of the board as an int8 array indexed by square.
+        Each entry is the piece type, negated for black pieces, or 0 for an empty square.
+        The array is built once per position and is read-only.
+        If the parent position has one, only the squares changed by the last move are updated from it.
+
+        :return: An array of 64 signed piece codes.
+        :rtype: np.ndarray
+        """
+        if self._piece_array is not None:
+            return self._piece_array
+
+        board = self.board
+        parent_piece_array = self._stack[-1][2] if self._stack else None
+        if parent_piece_array is not None:
+            piece_array = parent_piece_array.copy()
+            white = board.occupied_co[chess.WHITE]
+            for square in chess.scan_forward(self._changed_squares):
+                piece_type = board.piece_type_at(square) or 0
+                piece_array[square] = (
+                    piece_type if white & chess.BB_SQUARES[square] else -piece_type
+                )
+        else:
+            black, white = board.occupied_co
+            codes = [0] * 64
+            for piece_type, mask in zip(
+                chess.PIECE_TYPES,
+                (
+                    board.pawns,
+                    board.knights,
+                    board.bishops,
+                    board.rooks,
+                    board.queens,
+                    board.kings,
+                ),
+            ):
+                for square in chess.scan_forward(mask & white):
+                    codes[square] = piece_type
+                for square in chess.scan_forward(mask & black):
+                    codes[square] = -piece_type
+            piece_array = np.array(codes, dtype=np.int8)
+
+        piece_array.flags.writeable = False
+        self._piece_array = piece_array
+        return piece_array
 
     def piece_at(self, square: chess.Square) -> Optional[chess.Piece]:
         """
@@ -105,10 +458,28 @@ class BoardPyChess(Board):
         :param square: The target square.
         :type square: chess.Square
         :return: The piece at the specified square, or None if the square is empty.
+                 Pieces are shared between calls, so must not be modified.
         :rtype: Optional[chess.Piece]
         """
-        return self.board.piece_at(square)
+        board = self.board
+        if piece_type := board.piece_type_at(square):
+            return _PIECES[
+                bool(board.occupied_co[chess.WHITE] & chess.BB_SQUARES[square])
+            ][piece_type]
+        return None
 
+    def piece_type_at(self, square: chess.Square) -> Optional[chess.PieceType]:
+        """
+        Get the type of the piece at the specified square, without building a piece object.
+
+        :param square: The target square.
+        :type square: chess.Square
+        :return: The piece type at the specified square, or None if the square is empty.
+        :rtype: Optional[chess.PieceType]
+        """
+        return self.board.piece_type_at(square)
+
+    @final
     def is_capture(self, move: chess.Move) -> bool:
         """
         Check if a given move is a capture.
@@ -129,6 +500,7 @@ class BoardPyChess(Board):
         """
         return self.board.is_en_passant(move)
 
+    @final
     def is_check(self) -> bool:
         """
         Check if the current side to move is in check.
@@ -136,7 +508,9 @@ class BoardPyChess(Board):
         :return: True if is the current side to move is in check, false otherwise.
         :rtype: bool
         """
-        return self.board.is_check()
+        if self._is_check is None:
+            self._is_check = self.board.is_check()
+        return self._is_check
 
     def fen(self) -> str:
         """
@@ -147,6 +521,20 @@ class BoardPyChess(Board):
         """
         return self.board.fen()
 
+    def uci(self, move: chess.Move) -> str:
+        """
+        Get the Universal Chess Interface (UCI) notation of a move.
+
+        :param move: The move to convert.
+        :type move: chess.Move
+        :return: UCI-formatted move string, "0000" for the null move.
+        :rtype: str
+        """
+        if not move or move.drop:
+            return move.uci()
+        uci = _UCI_NAMES[move.from_square][move.to_square]
+        return uci + chess.piece_symbol(move.promotion) if move.promotion else uci
+
     def has_queenside_castling_rights(self, color: chess.Color) -> bool:
         """
         Check if the specified color has queenside castling rights.
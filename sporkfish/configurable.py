@@ -1,6 +1,23 @@
-from typing import Any, Dict
+import functools
+import inspect
+from typing import Any, Dict, Optional, Tuple, Type
 
-import yaml
+
+@functools.lru_cache(maxsize=1)
+def _yaml_safe_loader_dumper() -> Tuple[Type, Type]:
+    """
+    Import PyYAML on first use, so that configs built from dicts never pay for it.
+    The libyaml backed loader and dumper are preferred, when PyYAML is built with libyaml.
+
+    :returns: The safe YAML loader and dumper classes.
+    :rtype: Tuple[Type, Type]
+    """
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper, SafeLoader  # type: ignore
+    return SafeLoader, SafeDumper
 
 
 class Configurable:
@@ -13,6 +30,28 @@ class Configurable:
         from_dict: Create an object from a dictionary.
     """
 
+    # No instance dict of its own, so subclasses may declare __slots__
+    __slots__ = ()
+
+    @classmethod
+    def _public_attrs(cls) -> Tuple[str, ...]:
+        """
+        Get the names of the attributes serialized for this class, computed once per class.
+        These are the parameters of __init__, so that the serialized attributes round-trip through from_dict.
+
+        :returns: The attribute names.
+        :rtype: Tuple[str, ...]
+        """
+        attrs: Optional[Tuple[str, ...]] = cls.__dict__.get("_PUBLIC_ATTRS")
+        if attrs is None:
+            attrs = tuple(
+                name
+                for name in inspect.signature(cls.__init__).parameters
+                if name != "self"
+            )
+            setattr(cls, "_PUBLIC_ATTRS", attrs)
+        return attrs
+
     def to_yaml(self) -> str:
         """
         Serialize the object to a YAML-formatted string.
@@ -21,10 +60,11 @@ class Configurable:
         :rtype: str
         """
         cls_name = type(self).__name__
-        data = {
-            cls_name: {k: v for k, v in vars(self).items() if not k.startswith("__")}
-        }
-        yml = yaml.safe_dump(data)
+        data = {cls_name: {k: getattr(self, k) for k in type(self)._public_attrs()}}
+        import yaml
+
+        _, dumper = _yaml_safe_loader_dumper()
+        yml = yaml.dump(data, Dumper=dumper)
         return yml
 
     @classmethod
@@ -38,8 +78,11 @@ class Configurable:
         :returns: Deserialized object.
         :rtype: Any
         """
-        d = yaml.safe_load(yml).get(cls.__name__)
-        return Configurable.from_dict(d)
+        import yaml
+
+        loader, _ = _yaml_safe_loader_dumper()
+        d = yaml.load(yml, Loader=loader).get(cls.__name__)
+        return cls.from_dict(d)
 
     @classmethod
     def from_dict(cls, d: Dict[Any, Any]) -> Any:
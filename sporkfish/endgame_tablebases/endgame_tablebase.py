@@ -9,8 +9,13 @@ from sporkfish.board.board import Board
 class EndgameTablebase(ABC):
     """
     Abstract base class for handling the endgame tablebase in chess engines.
+    Tablebases are only queried at the root, by the engine before searching, never from within the search:
+    a query may probe every legal move or make a network request.
+    Implementations should reject positions they cannot answer from the piece count, before any other work.
 
     :method query(board: Board) -> Optional[chess.Move]: Abstract method to query the endgame tablebase.
+    :method prefetch(board: Board, move: chess.Move) -> None: Prepare for the positions after a move, by default nothing.
+    :method close() -> None: Release what the tablebase holds, such as background work, by default nothing.
     """
 
     @abstractmethod
@@ -24,3 +29,22 @@ class EndgameTablebase(ABC):
         :rtype: Optional[chess.Move]
         """
         pass
+
+    def prefetch(self, board: Board, move: chess.Move) -> None:
+        """
+        Prepare for querying the positions that may follow a move, while the opponent thinks.
+        By default nothing is done, tablebases answering slowly may override this.
+
+        :param board: The current state of the chess board, before the move.
+        :type board: Board
+        :param move: The move about to be played.
+        :type move: chess.Move
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Release what the tablebase holds, such as background work, once it will no longer be queried.
+        By default nothing is held.
+        """
+        pass
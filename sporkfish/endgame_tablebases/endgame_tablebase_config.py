@@ -22,6 +22,8 @@ class EndgameTablebaseConfig(Configurable):
     :type endgame_tablebase_mode: EndgameTablebaseMode, optional
     """
 
+    __slots__ = ("endgame_tablebase_path", "endgame_tablebase_mode")
+
     def __init__(
         self,
         endgame_tablebase_path: Optional[str] = None,
@@ -1,8 +1,12 @@
+import concurrent.futures
+import functools
 import logging
-from typing import Optional
+import time
+from typing import List, Optional
 
 import chess
 import requests
+from requests.adapters import HTTPAdapter
 
 from sporkfish.board.board import Board
 from sporkfish.endgame_tablebases.endgame_tablebase import EndgameTablebase
@@ -13,15 +17,89 @@ class LilaTablebase(EndgameTablebase):
     Class for handling the lila endgame tablebase in chess engines.
 
     :ivar BASE_URL: The base URL for the lila endgame tablebase service.
+    :ivar MAX_PIECES: The maximum number of pieces of positions the service covers.
+    :ivar MAX_CONSECUTIVE_FAILURES: How many queries in a row may fail before the service is skipped.
+    :ivar DISABLED_SECONDS: How long the service is skipped for, once too many queries in a row failed.
+    :ivar CACHE_SIZE: The maximum number of positions whose responses are cached.
+    :ivar TIMEOUT_SECONDS: How long a request may wait to connect to, then to read from the tablebase service.
+    :ivar MAX_PREFETCHED_REPLIES: The maximum number of opponent replies prefetched after a move.
 
     :method __init__() -> None: Initializes the LilaTablebase instance.
     :method query(board_fen: str) -> Optional[chess.Move]: Queries the tablebase service for the best move given a board position in FEN format.
+    :method prefetch(board: Board, move: chess.Move) -> None: Queries the positions after the opponent's replies in the background.
+    :method close() -> None: Cancels the prefetches not yet started.
     """
 
     BASE_URL = "http://tablebase.lichess.ovh/standard?fen="
+    MAX_PIECES = 7
+    MAX_CONSECUTIVE_FAILURES = 3
+    DISABLED_SECONDS = 30.0
+    CACHE_SIZE = 4096
+    TIMEOUT_SECONDS = (0.2, 0.5)
+    MAX_PREFETCHED_REPLIES = 8
 
     def __init__(self) -> None:
         EndgameTablebase.__init__(self)
+        # Reuse the connection across queries, avoiding a handshake per query.
+        # Failed requests are not retried, so that the timeout bounds how long a query takes.
+        self._session = requests.Session()
+        self._session.mount(
+            "http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+        )
+        # Queries failed in a row, and the monotonic time until which the service is skipped
+        self._failures = 0
+        self._disabled_until = 0.0
+        # Best move of each position queried, so that repeated positions skip the round-trip.
+        # Only successful responses are cached, as failures raise.
+        self._query_fen = functools.lru_cache(maxsize=LilaTablebase.CACHE_SIZE)(
+            self._query_fen_uncached
+        )
+        # Fills the cache in the background, while the opponent thinks
+        self._prefetcher = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="lila-prefetch"
+        )
+
+    @staticmethod
+    def _fen_key(board: Board) -> str:
+        """
+        Key a position for the cache by its FEN without the move counters,
+        so that positions reached again hit the cache.
+
+        :param board: The current state of the chess board.
+        :type board: Board
+        :return: The FEN of the position without the move counters.
+        :rtype: str
+        """
+        return board.fen().rsplit(" ", 2)[0]
+
+    def _is_disabled(self) -> bool:
+        """
+        Whether the service is being skipped, after too many queries in a row failed.
+
+        :return: True if the service should not be queried, False otherwise.
+        :rtype: bool
+        """
+        return time.monotonic() < self._disabled_until
+
+    def _query_fen_uncached(self, fen: str) -> Optional[str]:
+        """
+        Queries the tablebase service for the best move given a position.
+
+        :param fen: The position, in FEN format without the move counters.
+        :type fen: str
+        :return: The best move in UCI format, or `None` if no move is found.
+        :rtype: Optional[str]
+        :raises requests.exceptions.RequestException: If there is an issue connecting to the tablebase service.
+        :raises KeyError: If the response of the tablebase service cannot be parsed.
+        """
+        response = self._session.get(
+            f"{LilaTablebase.BASE_URL}{fen} 0 1", timeout=LilaTablebase.TIMEOUT_SECONDS
+        ).json()
+        return (
+            response["moves"][0]["uci"]
+            if len(response["moves"]) > 0 and response["dtz"]
+            else None
+        )
 
     def query(self, board: Board) -> Optional[chess.Move]:
         """
@@ -34,14 +112,17 @@ class LilaTablebase(EndgameTablebase):
         :raises ConnectionError: If there is an issue connecting to the tablebase service.
         """
 
-        full_url = LilaTablebase.BASE_URL + board.fen()
+        # Positions the service does not cover are not sent
+        if chess.popcount(board.occupied) > LilaTablebase.MAX_PIECES:
+            return None
+        # Nor are any, for a while after failing to connect too many times in a row
+        if self._is_disabled():
+            return None
+
         try:
-            response = requests.get(full_url).json()
-            best_move = (
-                chess.Move.from_uci(response["moves"][0]["uci"])
-                if len(response["moves"]) > 0 and response["dtz"]
-                else None
-            )
+            best_uci = self._query_fen(LilaTablebase._fen_key(board))
+            self._failures = 0
+            best_move = chess.Move.from_uci(best_uci) if best_uci else None
 
             if best_move:
                 logging.debug("Lila query succeeded. Best move retrieved: {best_move}")
@@ -52,7 +133,69 @@ class LilaTablebase(EndgameTablebase):
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to connect to Lila tablebase service, error: {e}")
+            self._failures += 1
+            if self._failures > LilaTablebase.MAX_CONSECUTIVE_FAILURES:
+                self._disabled_until = time.monotonic() + LilaTablebase.DISABLED_SECONDS
             return None
         except KeyError as e:
             logging.error(f"Failed to parse Lila tablebase response, error: {e}")
             return None
+
+    def _prefetch_fen(self, fen: str) -> None:
+        """
+        Query the tablebase service for a position, only to cache its response.
+
+        :param fen: The position, in FEN format without the move counters.
+        :type fen: str
+        """
+        # Failures are only logged: a speculative request must not stop queries of the position played
+        try:
+            self._query_fen(fen)
+        except requests.exceptions.RequestException as e:
+            logging.debug(f"Failed to prefetch from Lila tablebase service, error: {e}")
+        except KeyError as e:
+            logging.debug(
+                f"Failed to parse prefetched Lila tablebase response, error: {e}"
+            )
+
+    def prefetch(self, board: Board, move: chess.Move) -> None:
+        """
+        Query the positions after the opponent's replies to our move in the background,
+        so that our next query is answered from the cache.
+        Captures are prefetched first, as they lead to new material.
+
+        :param board: The current state of the chess board, before our move.
+        :type board: Board
+        :param move: The move we are about to play.
+        :type move: chess.Move
+        """
+        # Our move and the reply capture at most two pieces
+        if (
+            chess.popcount(board.occupied) > LilaTablebase.MAX_PIECES + 2
+            or self._is_disabled()
+        ):
+            return
+
+        board.push(move)
+        fens: List[str] = []
+        replies = sorted(
+            board.legal_moves, key=lambda reply: not board.is_capture(reply)
+        )
+        for reply in replies:
+            board.push(reply)
+            if chess.popcount(board.occupied) <= LilaTablebase.MAX_PIECES:
+                fens.append(LilaTablebase._fen_key(board))
+            board.pop()
+            if len(fens) == LilaTablebase.MAX_PREFETCHED_REPLIES:
+                break
+        board.pop()
+
+        for fen in fens:
+            self._prefetcher.submit(self._prefetch_fen, fen)
+
+    def close(self) -> None:
+        """
+        Cancel the prefetches not yet started, without waiting for those in flight.
+        Otherwise, exiting the interpreter waits for every queued prefetch.
+        """
+        self._prefetcher.shutdown(wait=False, cancel_futures=True)
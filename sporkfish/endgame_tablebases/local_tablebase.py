@@ -1,13 +1,15 @@
 import logging
 import os
 import sys
+import threading
 from enum import IntEnum, auto
-from typing import Optional, Tuple
+from typing import Dict, Hashable, Iterator, Optional, Tuple
 
 import chess
 import chess.syzygy
 
 from sporkfish.board.board import Board
+from sporkfish.board.board_py_chess import BoardPyChess
 from sporkfish.endgame_tablebases.endgame_tablebase import EndgameTablebase
 from sporkfish.endgame_tablebases.endgame_tablebase_config import EndgameTablebaseConfig
 
@@ -27,6 +29,33 @@ class LocalTablebase(EndgameTablebase):
         CURSED_WIN = auto()
         UNCONDITIONAL_WIN = auto()
 
+    # Category of DTZ values in ascending order of DTZ, indexed by how many of the category boundaries
+    # a DTZ value reaches. Categories are stored as plain ints, as ranks are compared for every probed move
+    # and IntEnum equality is several times slower than int equality.
+    # Each comes with the sign applied to DTZ values within it, so that the higher signed value is better.
+    # We want to:
+    # - save our blessed loss as quickly as possible
+    # - make the unconditional loss last as long as possible, in case they run out of time
+    # - unconditionally win as quickly as possible
+    # - extend our cursed win as much as possible, in case they run out of time
+    _DTZ_CATEGORIES_AND_SIGNS = (
+        (int(_DTZCategory.BLESSED_LOSS), 1),
+        (int(_DTZCategory.UNCONDITIONAL_LOSS), -1),
+        (int(_DTZCategory.UNCONDITIONAL_DRAW), 0),
+        (int(_DTZCategory.UNCONDITIONAL_WIN), -1),
+        (int(_DTZCategory.CURSED_WIN), 1),
+    )
+
+    # Rank of an unconditional win with a DTZ of 1, the highest possible
+    _BEST_RANK = (int(_DTZCategory.UNCONDITIONAL_WIN), -1)
+
+    # Maximum number of probed positions cached, the oldest is evicted beyond this
+    _DTZ_CACHE_SIZE = 1 << 16
+
+    # Tablebases opened so far by path, shared by all instances as they are safe to probe concurrently
+    _TABLEBASES: Dict[str, chess.syzygy.Tablebase] = {}
+    _TABLEBASES_LOCK = threading.Lock()
+
     def __init__(
         self, config: EndgameTablebaseConfig = EndgameTablebaseConfig()
     ) -> None:
@@ -40,6 +69,16 @@ class LocalTablebase(EndgameTablebase):
         EndgameTablebase.__init__(self)
         self._config = config
         self._db = None
+        # Scratch board the position is copied into for probing, reused across queries.
+        # Each thread gets its own, so that concurrent queries do not share a mutable board.
+        # The tablebase itself is safe to share: python-chess guards its table cache with a lock,
+        # and already maps the table files with MADV_RANDOM.
+        self._scratch_local = threading.local()
+        # Rank of each probed move (None if it has no usable DTZ), keyed by the transposition key
+        # of the position after it. Probing is independent of the halfmove clock, which the key leaves out.
+        self._dtz_cache: Dict[Hashable, Optional[Tuple[int, int]]] = {}
+        # Guards eviction, should queries run on several threads
+        self._dtz_cache_lock = threading.Lock()
         if self._config.endgame_tablebase_path:
             self._db = self._load(
                 self._resource_path(self._config.endgame_tablebase_path)
@@ -68,6 +107,7 @@ class LocalTablebase(EndgameTablebase):
     def _load(self, endgame_tablebase_path: str) -> Optional[chess.syzygy.Tablebase]:
         """
         Load the endgame database from the specified path.
+        A directory already loaded by any instance is not opened again.
 
         :param endgame_tablebase_path: Path to the endgame tablebase directory.
         :type endgame_tablebase_path: str
@@ -76,133 +116,113 @@ class LocalTablebase(EndgameTablebase):
         :rtype: Optional[chess.syzygy.Tablebase]
         """
 
-        try:
-            r = chess.syzygy.open_tablebase(endgame_tablebase_path)
-            logging.info(
-                f"Endgame tablebase succesfully loaded from {endgame_tablebase_path}."
-            )
-            return r
-        except FileNotFoundError as _:
-            logging.warning(
-                f"No endgame tablebase found at {endgame_tablebase_path}, skipping."
-            )
-            return None
+        with LocalTablebase._TABLEBASES_LOCK:
+            if r := LocalTablebase._TABLEBASES.get(endgame_tablebase_path):
+                return r
+            try:
+                r = chess.syzygy.open_tablebase(endgame_tablebase_path)
+                logging.info(
+                    f"Endgame tablebase succesfully loaded from {endgame_tablebase_path}."
+                )
+                LocalTablebase._TABLEBASES[endgame_tablebase_path] = r
+                return r
+            except FileNotFoundError as _:
+                logging.warning(
+                    f"No endgame tablebase found at {endgame_tablebase_path}, skipping."
+                )
+                return None
 
     def _should_query(self, board: Board, max_syzygy_size: int = 6) -> bool:
         """
         Determine whether to query the endgame tablebase based on the number of pieces on the board.
+        Positions with too few pieces to win are not queried.
 
         :param board: The current state of the chess board.
-        :type board: chess.Board
+        :type board: Board
         :param max_syzygy_size: The maximum number of pieces beyond which the endgame tablebase should not be queried, defaults to 6
         :type max_syzygy_size: int
 
         :return: True if the endgame tablebase should be queried, False otherwise
         :rtype: bool
         """
-        piece_count = 0
-        for square in chess.SQUARES:
-            if board.piece_at(square):
-                piece_count += 1
-            if piece_count > max_syzygy_size:
-                return False
-        return True
+        num_pieces = chess.popcount(board.occupied)
+        if num_pieces > max_syzygy_size:
+            return False
+        if num_pieces <= 2:
+            return False
 
-    def _categorize_dtz(self, dtz: int) -> "LocalTablebase._DTZCategory":
-        """
-        Categorizes the Distance to Zeroing (DTZ) value into different categories.
+        # Dead draws, with at most a minor piece besides the kings or only bishops on one square colour,
+        # need not be probed, as every move draws and the search may pick any of them
+        def pieces(piece_type: chess.PieceType) -> chess.Bitboard:
+            return board.pieces_mask(piece_type, chess.WHITE) | board.pieces_mask(
+                piece_type, chess.BLACK
+            )
 
-        :param dtz: The DTZ value to categorize, from our perspective.
-        :type dtz: int
-        :return: The category of the DTZ value.
-        :rtype: LocalTablebase._DTZCategory
-        """
-        assert isinstance(
-            dtz, int
-        ), f"Expected DTZ to be of type int but got {type(dtz).__name__}."
-        if dtz < -100:
-            return LocalTablebase._DTZCategory.BLESSED_LOSS
-        elif -100 <= dtz <= -1:
-            return LocalTablebase._DTZCategory.UNCONDITIONAL_LOSS
-        elif dtz == 0:
-            return LocalTablebase._DTZCategory.UNCONDITIONAL_DRAW
-        elif 1 <= dtz <= 100:
-            return LocalTablebase._DTZCategory.UNCONDITIONAL_WIN
-        else:
-            return LocalTablebase._DTZCategory.CURSED_WIN
+        if pieces(chess.PAWN) | pieces(chess.ROOK) | pieces(chess.QUEEN):
+            return True
+        bishops = pieces(chess.BISHOP)
+        return num_pieces > 3 and bool(
+            pieces(chess.KNIGHT)
+            or (bishops & chess.BB_LIGHT_SQUARES and bishops & chess.BB_DARK_SQUARES)
+        )
 
-    def _compare_dtz(self, dtz: int, best_dtz: int, category: _DTZCategory) -> int:
+    def _rank(self, dtz: int) -> Tuple[int, int]:
         """
-        Compares two Distance to Zeroing (DTZ) values based on their categories.
-        Returns the best resulting DTZ value, based on the condition of the category.
+        Rank a Distance to Zeroing (DTZ) value, such that more desirable values rank higher.
+        Values are ranked first by their category, then by their DTZ value within that category.
         For example, for the BLESSED_LOSS category, we want to save our loss as quickly as possible.
         BLESSED_LOSS values are negative, thus we want to pick the biggest one.
 
-        :param dtz: The DTZ value to compare.
+        :param dtz: The DTZ value to rank, from our perspective.
         :type dtz: int
-        :param best_dtz: The best DTZ value so far.
-        :type best_dtz: int
-        :param category: The category of the DTZ value.
-        :type category: LocalTablebase._DTZCategory
-        :return: The best resulting DTZ value, based on condition of the category.
-        :rtype: int
-        """
-        # We want to save our blessed loss as quickly as possible
-        if category == LocalTablebase._DTZCategory.BLESSED_LOSS:
-            return max(dtz, best_dtz)
-        # We want make the unconditional loss last as long as possible, in case they run out of time
-        elif category == LocalTablebase._DTZCategory.UNCONDITIONAL_LOSS:
-            return min(dtz, best_dtz)
-        elif category == LocalTablebase._DTZCategory.UNCONDITIONAL_DRAW:
-            return 0
-        # We want to unconditionally win as quickly as possible
-        elif category == LocalTablebase._DTZCategory.UNCONDITIONAL_WIN:
-            return min(dtz, best_dtz)
-        # We want to extend our cursed win as much as possible, in case they run out of time
-        elif category == LocalTablebase._DTZCategory.CURSED_WIN:
-            return max(dtz, best_dtz)
-        else:
-            raise TypeError(f"Invalid enum type '{category}' passed for _DTZCategory")
-
-    def _pick_move(
-        self,
-        category: _DTZCategory,
-        dtz: int,
-        move: chess.Move,
-        best_category: _DTZCategory,
-        best_dtz: int,
-        best_move: Optional[chess.Move],
-    ) -> Tuple[_DTZCategory, int, Optional[chess.Move]]:
-        """
-        Picks the best move based on the category and DTZ score.
-
-        Moves are first compared by their category, then their DTZ score within that category.
-        If the category is more desirable than the rolling best category, then take the new move.
-        If the category is equally desirable as the rolling best category,
-        then pick the move based on the most desirable DTZ score (conditioned on the type of category).
-        If the new best DTZ score is different than the current score, then take the new move.
-
-        :param category: The category of the current move.
-        :type category: _DTZCategory
-        :param dtz: The DTZ (Distance to Zeroing) value of the current move.
-        :type dtz: int
-        :param move: The move to consider.
-        :type move: chess.Move
-        :param best_category: The category of the best move so far.
-        :type best_category: _DTZCategory
-        :param best_dtz: The DTZ value of the best move so far.
-        :type best_dtz: int
-        :param best_move: The best move so far.
-        :type best_move: Optional[chess.Move]
-        :return: A tuple containing the category, DTZ value, and move to pick.
-        :rtype: Tuple[_DTZCategory, int, Optional[chess.Move]]
-        """
-        if category > best_category:
-            return category, dtz, move
-        elif category == best_category:
-            if self._compare_dtz(dtz, best_dtz, best_category) != best_dtz:
-                return category, dtz, move
-        return best_category, best_dtz, best_move
+        :return: A tuple of the category and the DTZ value signed so that higher is better.
+        :rtype: Tuple[int, int]
+        """
+        category, sign = LocalTablebase._DTZ_CATEGORIES_AND_SIGNS[
+            (dtz >= -100) + (dtz >= 0) + (dtz > 0) + (dtz > 100)
+        ]
+        return category, sign * dtz
+
+    def _copy_to_scratch(self, board: Board) -> chess.Board:
+        """
+        Copy the position into the scratch chess.Board, which the endgame tablebase probes.
+        The bitboards are copied directly, avoiding a round-trip through FEN.
+        Castling rights are assumed standard, and the halfmove clock is reset as probing does not depend on it.
+
+        :param board: The current chess board position.
+        :type board: Board
+        :return: The scratch board of this thread, holding the position with an empty move stack.
+        :rtype: chess.Board
+        """
+        scratch: Optional[chess.Board] = getattr(self._scratch_local, "board", None)
+        if scratch is None:
+            scratch = self._scratch_local.board = chess.Board.empty()
+        pieces_mask = board.pieces_mask
+        (
+            scratch.pawns,
+            scratch.knights,
+            scratch.bishops,
+            scratch.rooks,
+            scratch.queens,
+            scratch.kings,
+        ) = (
+            pieces_mask(piece_type, chess.WHITE) | pieces_mask(piece_type, chess.BLACK)
+            for piece_type in chess.PIECE_TYPES
+        )
+        scratch.occupied_co[chess.WHITE] = board.occupied_co(chess.WHITE)
+        scratch.occupied_co[chess.BLACK] = board.occupied_co(chess.BLACK)
+        scratch.occupied = board.occupied
+        scratch.turn = board.turn
+        scratch.castling_rights = (
+            (chess.BB_H1 if board.has_kingside_castling_rights(chess.WHITE) else 0)
+            | (chess.BB_A1 if board.has_queenside_castling_rights(chess.WHITE) else 0)
+            | (chess.BB_H8 if board.has_kingside_castling_rights(chess.BLACK) else 0)
+            | (chess.BB_A8 if board.has_queenside_castling_rights(chess.BLACK) else 0)
+        )
+        scratch.ep_square = board.ep_square
+        scratch.halfmove_clock = 0
+        scratch.clear_stack()
+        return scratch
 
     def query(self, board: Board) -> Optional[chess.Move]:
         """
@@ -217,36 +237,74 @@ class LocalTablebase(EndgameTablebase):
         """
 
         if self._db and self._should_query(board):
-            # We need to use a chess.Board() to be compatible with the endgame tablebase
-            # This is a small performace hit but is miniscule compared to searching
-            cboard = chess.Board()
-            cboard.set_fen(board.fen())
-            best_category, best_dtz, best_move = (
-                LocalTablebase._DTZCategory.UNCONDITIONAL_LOSS,
-                -sys.maxsize,
-                None,
+            # A board backed by python-chess is probed directly, each move being popped after probing.
+            # Others are copied onto the scratch board.
+            cboard = (
+                board.board
+                if isinstance(board, BoardPyChess)
+                else self._copy_to_scratch(board)
             )
-            for move in board.legal_moves:
-                cboard.push(move)
+            # Bound once, as the probe runs for every legal move.
+            # Nearly all of its time is spent decompressing the tablebase inside python-chess.
+            # That is pure Python and holds the GIL, so moves are probed sequentially on the one
+            # scratch board: probing copies of it on a thread pool is no faster.
+            push, pop, get_dtz = cboard.push, cboard.pop, self._db.get_dtz
+
+            dtz_cache = self._dtz_cache
+            dtz_cache_lock = self._dtz_cache_lock
+            transposition_key = cboard._transposition_key
+            rank = self._rank
+
+            def probe(move: chess.Move) -> Optional[Tuple[int, int]]:
+                push(move)
+                key = transposition_key()
+                if key in dtz_cache:
+                    pop()
+                    return dtz_cache[key]
                 # Refer to https://python-chess.readthedocs.io/en/latest/syzygy.html
                 # Probe the opponents DTZ, after our legal move.
                 # Our DTZ is the inversion of that.
                 # TODO: check if there any issues for rounding error
-                # Note that we have to check for None, because:
+                # Note that we have to check for None, rather than falsiness which would also drop draws, because:
                 # a) we may not have the corresponding Syzygy tablebase file to our position,
                 # b) moreover the position may not exist within the Syzygy tablebase, see e.g.
                 #    5k2/8/8/8/2B5/8/3B4/3K4 w - - 2 2, move=c4d8 doesn't exist in the tablebase.
-                dtz = -opp_dtz if (opp_dtz := self._db.get_dtz(cboard)) else None
-                cboard.pop()
-
-                if not dtz:
-                    continue
+                opp_dtz = get_dtz(cboard)
+                pop()
+                move_rank = rank(-opp_dtz) if opp_dtz is not None else None
+                with dtz_cache_lock:
+                    if len(dtz_cache) >= LocalTablebase._DTZ_CACHE_SIZE:
+                        del dtz_cache[next(iter(dtz_cache))]
+                    dtz_cache[key] = move_rank
+                return move_rank
 
-                category = self._categorize_dtz(dtz)
-                best_category, best_dtz, best_move = self._pick_move(
-                    category, dtz, move, best_category, best_dtz, best_move
+            def ranked_moves() -> Iterator[Tuple[Tuple[int, int], chess.Move]]:
+                # Probe moves grouped by the material they leave, i.e. the tablebase file they hit:
+                # quiet moves first, then captures by captured piece type and promotions by promoted type.
+                # Equally ranked moves are then picked in this order.
+                piece_type_at = board.piece_type_at
+                moves = sorted(
+                    board.legal_moves,
+                    key=lambda move: (
+                        piece_type_at(move.to_square) or 0,
+                        move.promotion or 0,
+                    ),
                 )
+                for move in moves:
+                    if move_rank := probe(move):
+                        yield move_rank, move
+                        # Nothing beats winning with the next move zeroing, so stop probing
+                        if move_rank == LocalTablebase._BEST_RANK:
+                            return
+
+            # max keeps the first of equally ranked moves
+            best = max(ranked_moves(), key=lambda candidate: candidate[0], default=None)
 
-            return best_move
+            # Unconditional losses rank lowest, and are left to the search to drag out
+            if (
+                best is not None
+                and best[0][0] != LocalTablebase._DTZCategory.UNCONDITIONAL_LOSS
+            ):
+                return best[1]
 
         return None
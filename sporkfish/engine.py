@@ -52,17 +52,43 @@ class Engine:
         :rtype: chess.Move
         """
         if opening_move := self._opening_book.query(board):
-            logging.info(f"Best move {opening_move.uci()} found in opening book.")
+            logging.info(f"Best move {board.uci(opening_move)} found in opening book.")
             return opening_move
         elif end_move := self._endgame_tablebase.query(board):
-            logging.info(f"Best move {end_move.uci()} found in endgame tablebase.")
-            return end_move
-
-        logging.info(
-            "No move found in opening book or endgame tablebase or they are not configured. Delegating to searcher."
-        )
-        _, searched_move = self._searcher.search(board, timeout)
-        return searched_move
+            logging.info(f"Best move {board.uci(end_move)} found in endgame tablebase.")
+            best_move = end_move
+        else:
+            logging.info(
+                "No move found in opening book or endgame tablebase or they are not configured. Delegating to searcher."
+            )
+            _, best_move = self._searcher.search(board, timeout)
+
+        self._endgame_tablebase.prefetch(board, best_move)
+        return best_move
+
+    def new_game(self) -> None:
+        """
+        Prepare for a new game, forgetting what the searcher learned in previous ones.
+        """
+        self._searcher.new_game()
+
+    def stop(self) -> None:
+        """
+        Request that the searcher stops its current search.
+        """
+        self._searcher.stop()
+
+    def close(self) -> None:
+        """
+        Release what the engine holds, once it will no longer be used.
+        """
+        self._endgame_tablebase.close()
+
+    def reset_stop(self) -> None:
+        """
+        Withdraw any stop requested earlier, ahead of a new search.
+        """
+        self._searcher.reset_stop()
 
     def score(self, board: Board, timeout: Optional[float] = None) -> float:
         """
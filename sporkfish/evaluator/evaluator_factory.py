@@ -1,3 +1,5 @@
+from typing import Callable, Dict
+
 from sporkfish.evaluator.evaluator import Evaluator
 from sporkfish.evaluator.evaluator_config import EvaluatorConfig, EvaluatorMode
 from sporkfish.evaluator.pesto import Pesto
@@ -8,6 +10,11 @@ class EvaluatorFactory:
     Factory class for creating instances of different evaluator types.
     """
 
+    # Constructor for each supported evaluator mode, looked up directly rather than branching on the mode
+    _REGISTRY: Dict[EvaluatorMode, Callable[[], Evaluator]] = {
+        EvaluatorMode.PESTO: Pesto,
+    }
+
     @staticmethod
     def create(evaluator_cfg: EvaluatorConfig) -> Evaluator:
         """
@@ -19,11 +26,11 @@ class EvaluatorFactory:
         :rtype: Evaluator
         :raises TypeError: If the specified evaluator type is not supported.
         """
-
-        if evaluator_cfg.evaluator_mode is EvaluatorMode.PESTO:
-            return Pesto()
-        else:
+        try:
+            constructor = EvaluatorFactory._REGISTRY[evaluator_cfg.evaluator_mode]
+        except KeyError:
             raise TypeError(
                 f"EvaluatorFactory does not support the creation of Evaluator type: \
-                {type(evaluator_cfg.evaluator_mode).__name__}."
-            )
+                {evaluator_cfg.evaluator_mode.name}."
+            ) from None
+        return constructor()
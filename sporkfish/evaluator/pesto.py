@@ -1,11 +1,117 @@
-from typing import Dict
+from typing import Dict, Mapping, Sequence, Tuple
 
 import chess
+import numpy as np
+from numba import njit
 
 from sporkfish.board.board import Board
 from sporkfish.evaluator.evaluator import Evaluator
 
 
+def _signed_tables(pesto: Mapping[chess.PieceType, Sequence[int]]) -> np.ndarray:
+    """
+    Fold the piece-square tables of both colors into one table indexed by signed piece code and square.
+    Row 6 + piece_type holds the white scores, row 6 - piece_type the negated black scores
+    and row 6 is all zeros for empty squares.
+
+    :param pesto: The piece-square tables, from A8 to H1, keyed by piece type.
+    :type pesto: Mapping[chess.PieceType, Sequence[int]]
+    :return: A (13, 64) table of scores from white's point of view.
+    :rtype: np.ndarray
+    """
+    table = np.zeros((13, 64), dtype=np.int64)
+    for piece_type, psqt in pesto.items():
+        for square in chess.SQUARES:
+            # White reads the table at the board square, black at the vertically flipped square
+            table[6 + piece_type, square] = psqt[square]
+            table[6 - piece_type, square] = -psqt[square ^ 56]
+    return table
+
+
+def _packed_tables(mg_table: np.ndarray, eg_table: np.ndarray) -> np.ndarray:
+    """
+    Pack the middlegame and endgame tables into one, so that a single load yields both scores.
+    Each entry is mg * 2^16 + eg. Packed entries sum to the packed sums of their scores,
+    which unpack exactly as long as the endgame sum fits in 16 bits, see _unpack.
+
+    :param mg_table: The signed middlegame table.
+    :type mg_table: np.ndarray
+    :param eg_table: The signed endgame table.
+    :type eg_table: np.ndarray
+    :return: A (13, 64) table of packed scores from white's point of view.
+    :rtype: np.ndarray
+    """
+    return np.add(mg_table * (1 << 16), eg_table)
+
+
+@njit(cache=True, nogil=True)
+def _unpack(packed: int) -> Tuple[int, int]:
+    """
+    Split a sum of packed scores into its middlegame and endgame sums.
+
+    :param packed: The sum of packed scores.
+    :type packed: int
+    :return: The middlegame and endgame sums.
+    :rtype: Tuple[int, int]
+    """
+    # Sign extend the low 16 bits, the rest is what the endgame sum borrowed from or carried into them
+    eg_score = ((packed + 0x8000) & 0xFFFF) - 0x8000
+    return (packed - eg_score) >> 16, eg_score
+
+
+def _signed_phases(phases: Dict[chess.PieceType, int]) -> np.ndarray:
+    """
+    Lay out the game phase weights by signed piece code, offset by 6.
+
+    :param phases: The game phase weight of each piece type.
+    :type phases: Dict[chess.PieceType, int]
+    :return: An array of 13 game phase weights.
+    :rtype: np.ndarray
+    """
+    table = np.zeros(13, dtype=np.int64)
+    for piece_type, phase in phases.items():
+        table[6 + piece_type] = table[6 - piece_type] = phase
+    return table
+
+
+@njit(cache=True, nogil=True)
+def _evaluate(
+    pieces: np.ndarray,
+    packed_table: np.ndarray,
+    phase_table: np.ndarray,
+    turn: bool,
+) -> float:
+    """
+    Evaluate a position in one compiled pass over its squares, tapering the middlegame and endgame scores by game phase.
+
+    :param pieces: The signed piece code of every square.
+    :type pieces: np.ndarray
+    :param packed_table: The signed middlegame and endgame tables, packed, see _packed_tables.
+    :type packed_table: np.ndarray
+    :param phase_table: The signed game phase weights, see _signed_phases.
+    :type phase_table: np.ndarray
+    :param turn: The side to move, True for white.
+    :type turn: bool
+    :return: The evaluation score from the point of view of the side to move.
+    :rtype: float
+    """
+    packed = 0
+    phase = 0
+    for square in range(64):
+        # Row index into the signed tables
+        code = pieces[square] + 6
+        packed += packed_table[code, square]  # type: ignore
+        phase += phase_table[code]  # type: ignore
+    mg_score, eg_score = _unpack(packed)
+    if not turn:
+        mg_score, eg_score = -mg_score, -eg_score
+
+    mg_phase = min(24, phase)
+    eg_phase = 24 - mg_phase
+
+    return ((mg_score * mg_phase) + (eg_score * eg_phase)) / 24  # type: ignore
+
+
 class Pesto(Evaluator):
     """
     A class responsible for evaluating the chess position.
@@ -202,8 +308,10 @@ class Pesto(Evaluator):
         chess.KING: 0,
     }
 
-    SQUARES = [i for i in range(64)]
-    VERTICALLY_FLIPPED_SQUARES = [i ^ 56 for i in range(64)]
+    MG_TABLE = _signed_tables(MG_PESTO)
+    EG_TABLE = _signed_tables(EG_PESTO)
+    PACKED_TABLE = _packed_tables(MG_TABLE, EG_TABLE)
+    PHASE_TABLE = _signed_phases(PHASES)
 
     def evaluate(self, board: Board) -> float:
         """
@@ -214,46 +322,12 @@ class Pesto(Evaluator):
         :return: The evaluation score.
         :rtype: float
         """
-
-        mg = {
-            chess.WHITE: 0,
-            chess.BLACK: 0,
-        }
-        eg = {
-            chess.WHITE: 0,
-            chess.BLACK: 0,
-        }
-
-        # Takes the vertically flipped square for white, take the initial square for black
-        # Assumes:
-        # - Chess board implements A1 as first element, H8 as last
-        # - Piece square table implements A8 as first element, H1 as last element
-        def flip(square: int, flipped_square: int, color: chess.Color) -> int:
-            return square if not color else flipped_square
-
-        phase = 0
-
-        for square in self.SQUARES:
-            # square ^ 56 flips the board vertically to match alignment of PSQT
-            flipped_square = self.VERTICALLY_FLIPPED_SQUARES[square]
-            piece = board.piece_at(flipped_square)
-            if piece:
-                aligned_square = flip(square, flipped_square, piece.color)
-                mg[piece.color] += self.MG_PESTO[piece.piece_type][
-                    aligned_square
-                ]
-                eg[piece.color] += self.EG_PESTO[piece.piece_type][
-                    aligned_square
-                ]
-                phase += self.PHASES[piece.piece_type]
-
-        mg_score = mg[board.turn] - mg[not board.turn]
-        eg_score = eg[board.turn] - eg[not board.turn]
-
-        mg_phase = min(24, phase)
-        eg_phase = 24 - mg_phase
-
-        return ((mg_score * mg_phase) + (eg_score * eg_phase)) / 24
+        return _evaluate(  # type: ignore
+            board.piece_array(),
+            self.PACKED_TABLE,
+            self.PHASE_TABLE,
+            board.turn,
+        )
 
     def piece_values(self) -> Dict[chess.PieceType, float]:
         """
@@ -12,6 +12,8 @@ class LichessBot(ABC):
     Methods:
     - run():
         Start the Lichess bot, listening to incoming events and playing games accordingly.
+    - close():
+        Release what the engine holds, once the bot will no longer be run.
     """
 
     _ACCEPTED_VARIANTS = ["standard"]
@@ -27,6 +29,12 @@ class LichessBot(ABC):
         )
         self._bot_id = bot_id
 
+    def close(self) -> None:
+        """
+        Release what the engine holds, once the bot will no longer be run.
+        """
+        self._sporkfish.close()
+
     def _get_best_move(
         self,
         color: int,
@@ -49,8 +57,9 @@ class LichessBot(ABC):
         command = "go"
 
         if time is not None and increment is not None:
-            time_ms = time * 1000
-            inc_ms = increment * 1000
+            # UCI times are whole milliseconds
+            time_ms = round(time * 1000)
+            inc_ms = round(increment * 1000)
             time_command = (
                 f" wtime {time_ms} winc {inc_ms}"
                 if not bool(color)
@@ -66,11 +75,14 @@ class LichessBot(ABC):
     def _set_position(self, moves: str) -> None:
         """
         Set the chess position based on a sequence of UCI moves (space delimited).
+        The full sequence is sent each time, the UCI client only applies the moves it has not seen.
 
-        :param moves: A sequence of chess moves.
+        :param moves: A sequence of chess moves, empty at the start of the game.
         :type moves: str
         """
-        self._sporkfish.send_command(f"position startpos moves {moves}")
+        self._sporkfish.send_command(
+            f"position startpos moves {moves}" if moves else "position startpos"
+        )
 
     @abstractmethod
     def run(self) -> None:
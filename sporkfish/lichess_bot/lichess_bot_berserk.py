@@ -1,6 +1,7 @@
 import datetime
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 import berserk
@@ -14,6 +15,7 @@ class LichessBotBerserk(LichessBot):
     """
     A class representing a Lichess bot powered by the Sporkfish chess engine.
     Powered by the synchronous berserk lichess API.
+    Games are played on a worker thread so the incoming event stream is not blocked by a game in progress.
     Not thread-safe (do not use with multithreading, might exceed rate limit of Lichess).
     """
 
@@ -28,6 +30,13 @@ class LichessBotBerserk(LichessBot):
         """
         super().__init__(bot_id)
         self._berserk = BerserkRetriable(token)
+        # There is a single engine, so at most one game is played at a time
+        self._game_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sporkfish-game"
+        )
+        self._game: Optional[Future] = None
+        # The challenge accepted but whose game has not started yet, if any
+        self._accepted_challenge_id: Optional[str] = None
 
     @property
     def client(self) -> berserk.Client:
@@ -89,8 +98,10 @@ class LichessBotBerserk(LichessBot):
         :param state: The current state of the game.
         :type state: Any
         """
-        # Check if it's the player's turn based on the number of moves and color
-        if len(prev_moves.split()) & 1 == color:
+        # Check if it's the player's turn based on the number of moves and color.
+        # Lichess separates moves by single spaces, so count them without splitting into a list.
+        num_moves = prev_moves.count(" ") + 1 if prev_moves else 0
+        if num_moves & 1 == color:
             self._set_position(prev_moves)
             time, inc = self._get_time(color, state)
             best_move = self._get_best_move(color, time, inc)
@@ -111,7 +122,8 @@ class LichessBotBerserk(LichessBot):
         :rtype: GameTerminationReason
         """
         game_full = next(states)
-        logging.debug(f"Full game data: {game_full}")
+        # Let logging format the states only when debug logging is enabled
+        logging.debug("Full game data: %s", game_full)
 
         color = 0 if game_full["white"].get("id") == self._bot_id else 1
         prev_moves_start: str = game_full["state"].get("moves", "")
@@ -129,30 +141,23 @@ class LichessBotBerserk(LichessBot):
 
         # Loop through subsequent game states
         for state in states:
-            logging.debug(f"Game state: {state}")
+            logging.debug("Game state: %s", state)
             if state["type"] == "gameState":
                 self._play_move(color, state["moves"], game_id, state)
             elif state["type"] == "gameStateResign":
                 return GameTerminationReason.RESIGNATION
             elif state["type"] == "opponentGone":
-                # Busy polling is fine, nothing else to do
+                # Nothing else to do until the claim window passes, so sleep rather than busy poll
                 # Alternative is to asynchronously wait while finding the PV, if PV is the same as opponents move then play
                 # But this is more complex and not necessary for now
-                can_claim_win = state["claimWinInSeconds"]
-                start = time.time()
-                while True:
-                    if state["gone"]:
-                        # Claim victory if opponent is gone for more than the claimWinInSeconds
-                        if time.time() - start > can_claim_win:
-                            try:
-                                self.client.board.claim_victory(game_id)
-                                return GameTerminationReason.OPPONENT_LEFT
-                            except Exception as e:
-                                logging.error(f"Error claiming victory: {e}")
-                                break
-                        # Otherwise, keep polling
-                    else:
-                        break
+                if state["gone"]:
+                    # Claim victory if opponent is gone for more than the claimWinInSeconds
+                    time.sleep(state["claimWinInSeconds"])
+                    try:
+                        self.client.board.claim_victory(game_id)
+                        return GameTerminationReason.OPPONENT_LEFT
+                    except Exception as e:
+                        logging.error(f"Error claiming victory: {e}")
 
         return GameTerminationReason.UNKNOWN
 
@@ -166,6 +171,10 @@ class LichessBotBerserk(LichessBot):
         :return: The reason for the game termination.
         :rtype: GameTerminationReason
         """
+        # Forget the previous game, waiting for the engine as UCI requires after ucinewgame
+        self._sporkfish.send_command("ucinewgame")
+        self._sporkfish.send_command("isready")
+
         states = self.client.bots.stream_game_state(game_id)
         return self._handle_states(game_id, states)
 
@@ -198,8 +207,9 @@ class LichessBotBerserk(LichessBot):
         :return: True if the challenge is accepted, False if it is declined.
         :rtype: bool
         """
-        if self._should_accept_challenge(event):
+        if self._should_accept_challenge(event) and not self._game_in_progress():
             self.client.bots.accept_challenge(event["challenge"]["id"])
+            self._accepted_challenge_id = event["challenge"]["id"]
             return True
         else:
             self.client.bots.decline_challenge(event["challenge"]["id"])
@@ -217,6 +227,57 @@ class LichessBotBerserk(LichessBot):
         """
         return self._play_game(event["game"]["fullId"])
 
+    def _event_action_start_game(self, event: Dict[str, Any]) -> Future:
+        """
+        Plays the specified game on the game worker thread, so that events keep being handled meanwhile.
+
+        :param event: The event containing information about the game.
+        :type event: Dict[str, Any]
+
+        :return: A future holding the reason for the game termination.
+        :rtype: Future
+        """
+        # The accepted challenge, if any, is now tracked by its game
+        self._accepted_challenge_id = None
+        self._game = self._game_executor.submit(self._event_action_play_game, event)
+        self._game.add_done_callback(self._log_game_result)
+        return self._game
+
+    def _event_action_challenge_withdrawn(self, event: Dict[str, Any]) -> None:
+        """
+        Forgets an accepted challenge whose game will not start, as it was canceled or declined.
+
+        :param event: The event containing information about the challenge.
+        :type event: Dict[str, Any]
+        """
+        if event["challenge"]["id"] == self._accepted_challenge_id:
+            self._accepted_challenge_id = None
+
+    def _game_in_progress(self) -> bool:
+        """
+        Whether a game is being played (or waiting to be played) on the game worker thread,
+        or about to start from an accepted challenge.
+
+        :return: True if a game is in progress, False otherwise.
+        :rtype: bool
+        """
+        return self._accepted_challenge_id is not None or (
+            self._game is not None and not self._game.done()
+        )
+
+    @staticmethod
+    def _log_game_result(game: Future) -> None:
+        """
+        Logs how a game played on the game worker thread ended.
+
+        :param game: The future of the finished game.
+        :type game: Future
+        """
+        if exception := game.exception():
+            logging.error(f"Error playing game: {exception}")
+        else:
+            logging.info(f"Game ended: {game.result()}")
+
     def _event_action_game_finish(self, event: Dict[str, Any]) -> None:
         """
         Posts a chat message in response to a game event.
@@ -231,14 +292,23 @@ class LichessBotBerserk(LichessBot):
 
     _event_actions = {
         "challenge": _event_action_accept_challenge,
-        "gameStart": _event_action_play_game,
+        "gameStart": _event_action_start_game,
         "gameFinish": _event_action_game_finish,
+        "challengeCanceled": _event_action_challenge_withdrawn,
+        "challengeDeclined": _event_action_challenge_withdrawn,
     }
 
     def run(self) -> None:
         """
         Start the Lichess bot, listening to incoming events sequentially and playing games accordingly.
+        Games are played on the game worker thread, the event stream is read on the calling thread.
+        Returns once the event stream ends and the game in progress, if any, is over.
         """
-        for event in self.client.bots.stream_incoming_events():
-            if action := self._event_actions.get(event.get("type", "")):
-                action(self, event)
+        try:
+            for event in self.client.bots.stream_incoming_events():
+                if action := self._event_actions.get(event.get("type", "")):
+                    action(self, event)
+        finally:
+            # Keep the game worker, so that the bot may be run again
+            if self._game is not None:
+                wait([self._game])
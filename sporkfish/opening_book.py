@@ -1,4 +1,6 @@
+import contextlib
 import logging
+import mmap
 import os
 import sys
 from typing import Optional
@@ -77,6 +79,10 @@ class OpeningBook:
 
         try:
             r = chess.polyglot.open_reader(opening_book_path)
+            # Have the OS read the book in ahead of the first query, rather than faulting its pages in from disk
+            # during the search for a move. Not available on all platforms, nor for empty books.
+            with contextlib.suppress(AttributeError, OSError):
+                r.mmap.madvise(mmap.MADV_WILLNEED)  # type: ignore
             logging.info(f"Opening book succesfully loaded from {opening_book_path}.")
             return r
         except FileNotFoundError as _:
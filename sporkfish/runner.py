@@ -1,12 +1,31 @@
+import functools
 import inspect
 import logging
+import queue
+import sys
+import threading
 from enum import Enum
+from typing import Optional
 
 from sporkfish.configurable import Configurable
 from sporkfish.lichess_bot.lichess_bot_berserk import LichessBotBerserk
 from sporkfish.uci_client import UCIClient
 
 
+@functools.lru_cache(maxsize=1)
+def _read_api_token(path: str = "api_token.txt") -> str:
+    """
+    Read the Lichess API token from file, once per process.
+
+    :param path: Path to the file containing the token.
+    :type path: str
+    :return: The token, without surrounding whitespace.
+    :rtype: str
+    """
+    with open(path) as f:
+        return f.read().strip()
+
+
 class RunMode(Enum):
     """Enumeration for different run modes."""
 
@@ -37,18 +56,55 @@ class Runner:
         """
         self._run_config = run_config
 
+    @staticmethod
+    def _read_uci_input(
+        client: UCIClient, commands: "queue.Queue[Optional[str]]"
+    ) -> None:
+        """
+        Read UCI commands from stdin and queue them for the main thread.
+
+        "stop" is forwarded to the client straight away, since the main thread may be busy searching.
+        Before a "go" is queued, earlier stops are withdrawn, once the commands queued before it are done.
+        This keeps stops in the order they were read: a stop read before a "go" reaches the earlier search,
+        and one read after it reaches its search, even if that search has not started yet.
+        A None is queued once stdin is closed.
+
+        :param client: The UCI client to forward "stop" to.
+        :type client: UCIClient
+        :param commands: The queue of commands consumed by the main thread.
+        :type commands: queue.Queue[Optional[str]]
+        """
+        for line in sys.stdin:
+            message = line.rstrip("\n")
+            if message.strip() == "stop":
+                client.stop()
+            else:
+                if message.split()[:1] == ["go"]:
+                    commands.join()
+                    client.reset_stop()
+                commands.put(message)
+        commands.put(None)
+
     @staticmethod
     def _run_uci() -> None:
         """
         Run the UCI (Universal Chess Interface) client.
 
         This method initializes a UCI client and sends user input as commands to the client.
+        Input is read on a separate thread so commands such as "stop" are handled during search.
         """
         logging.info("Running in UCI mode...")
         client = UCIClient(UCIClient.UCIProtocol.ResponseMode.PRINT)
-        while True:
-            message = input()
-            client.send_command(message)
+        commands: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(
+            target=Runner._read_uci_input, args=(client, commands), daemon=True
+        ).start()
+        try:
+            while (message := commands.get()) is not None:
+                client.send_command(message)
+                commands.task_done()
+        finally:
+            client.close()
 
     @staticmethod
     def _run_lichess() -> None:
@@ -58,9 +114,11 @@ class Runner:
         This method initializes a Lichess bot using the Berserk API and runs it.
         """
         logging.info("Running in Lichess mode...")
-        with open("api_token.txt") as f:
-            lichess_client = LichessBotBerserk(token=f.read())
-        lichess_client.run()
+        lichess_client = LichessBotBerserk(token=_read_api_token())
+        try:
+            lichess_client.run()
+        finally:
+            lichess_client.close()
 
     _mode_actions = {RunMode.LICHESS: _run_lichess, RunMode.UCI: _run_uci}
 
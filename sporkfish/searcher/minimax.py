@@ -1,8 +1,7 @@
-import copy
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Callable, Optional, Tuple
+from typing import Callable, Iterable, Optional, Tuple
 
 import chess
 import stopit
@@ -16,12 +15,11 @@ from sporkfish.searcher.move_ordering.move_order_config import MoveOrderMode
 from sporkfish.searcher.move_ordering.move_order_heuristic import MoveOrderHeuristic
 from sporkfish.searcher.move_ordering.move_orderer import MoveOrderer
 from sporkfish.searcher.move_ordering.mvv_lva_heuristic import MvvLvaHeuristic
-from sporkfish.searcher.searcher import Searcher
+from sporkfish.searcher.searcher import Searcher, SearchStopped
 from sporkfish.searcher.searcher_config import SearcherConfig
 from sporkfish.statistics import NodeTypes, PruningTypes
 from sporkfish.statistics import TranspositionTable as TranspositionTableNodeType
-from sporkfish.transposition_table import TranspositionTable
-from sporkfish.zobrist_hasher import ZobristHasher, ZobristStateInfo
+from sporkfish.transposition_table import Bound, TranspositionTable
 
 
 class MiniMaxVariants(Searcher, ABC):
@@ -29,6 +27,13 @@ class MiniMaxVariants(Searcher, ABC):
     Abstract base class for minimax like searchers
     """
 
+    # Shared null move, pushed on every null move pruning attempt.
+    # Moves are never mutated once created, so one instance avoids an allocation per node.
+    _NULL_MOVE = chess.Move.null()
+
+    # Interior nodes searched between checks for a stop request
+    _STOP_CHECK_INTERVAL = 1024
+
     @abstractmethod
     def _start_search_from_root(
         self, board_to_search: Board, depth: int, alpha: float, beta: float
@@ -59,7 +64,6 @@ class MiniMaxVariants(Searcher, ABC):
         super().__init__(searcher_config)
 
         if self._searcher_config.enable_transposition_table:
-            self._zobrist_hash = ZobristHasher()
             self._transposition_table = TranspositionTable(self._dict)
             logging.info("Enabled transposition table in search.")
         else:
@@ -67,10 +71,12 @@ class MiniMaxVariants(Searcher, ABC):
 
         self._evaluator = evaluator
         self._max_depth = searcher_config.max_depth
+        # Whether a depth has completed, so that a stop may abandon the depth in progress
+        self._stoppable = False
 
         # Killer move table - storing quiet beta-cut off moves
         self._killer_moves = (
-            [[chess.Move.null(), chess.Move.null()] for _ in range(self._max_depth + 1)]
+            [[self._NULL_MOVE, self._NULL_MOVE] for _ in range(self._max_depth + 1)]
             if self._searcher_config.move_order_config.move_order_mode
             == MoveOrderMode.KILLER_MOVE
             or self._searcher_config.move_order_config.move_order_mode
@@ -87,6 +93,17 @@ class MiniMaxVariants(Searcher, ABC):
             else None
         )
 
+    def new_game(self) -> None:
+        """
+        Forget what was learned while searching previous games, including the move ordering tables.
+        """
+        super().new_game()
+        if self._killer_moves is not None:
+            for killer_moves in self._killer_moves:
+                killer_moves[:] = [self._NULL_MOVE, self._NULL_MOVE]
+        if self._history_table is not None:
+            self._history_table.clear()
+
     @property
     def evaluator(self) -> Evaluator:
         return self._evaluator
@@ -128,6 +145,42 @@ class MiniMaxVariants(Searcher, ABC):
                 {type(order_type).__name__}."
             )
 
+    def _check_stop(self) -> None:
+        """
+        Unwind the search if a stop has been requested, checked every _STOP_CHECK_INTERVAL interior nodes.
+        Only once a depth has completed, so that there is a move to fall back on.
+
+        :raises SearchStopped: If the search should stop.
+        """
+        if (
+            self._statistics.visited[NodeTypes.NEGAMAX] % self._STOP_CHECK_INTERVAL == 0
+            and self._stoppable
+            and self._stop_event.is_set()
+        ):
+            raise SearchStopped
+
+    def _order_moves(self, board: Board, depth: int) -> Iterable[chess.Move]:
+        """
+        Order the legal moves of a non-root node from best to worst.
+        With MVV-LVA ordering, moves are generated in stages so quiet moves are only generated when needed.
+
+        :param board: The current state of the chess board.
+        :type board: Board
+        :param depth: The depth of the search.
+        :type depth: int
+
+        :return: The ordered legal moves.
+        :rtype: Iterable[chess.Move]
+        """
+        order_type = self._searcher_config.move_order_config.move_order_mode
+        if order_type is MoveOrderMode.MVV_LVA:
+            return MoveOrderer.order_moves_staged(MvvLvaHeuristic(board), board)
+        mo_heuristic = self._build_move_order_heuristic(board, depth)
+        ordered_moves: Iterable[chess.Move] = MoveOrderer.order_moves(
+            mo_heuristic, board.legal_moves
+        )
+        return ordered_moves
+
     def _update_killer_moves(self, move: chess.Move, depth: int) -> None:
         """
         Updates the killer move table.
@@ -213,7 +266,7 @@ class MiniMaxVariants(Searcher, ABC):
         depth: int,
         alpha: float,
         beta: float,
-        zobrist_state: Optional[ZobristStateInfo],
+        zobrist_hash: Optional[int],
     ) -> float:
         """
         Perform a quiescence search to help alleviate the horizon effect and improve checking of tactical possibilities.
@@ -239,14 +292,17 @@ class MiniMaxVariants(Searcher, ABC):
 
         # Probe the transposition table for an existing entry
         # We treat all cases as depth 0, so essentially as an static evaluation
-        if zobrist_state and (
-            tt_entry := self._transposition_table.probe(zobrist_state.zobrist_hash, 0)
+        if zobrist_hash is not None and (
+            tt_entry := self._transposition_table.probe(zobrist_hash, 0, alpha, beta)
         ):
             self._statistics.increment_visited(
                 TranspositionTableNodeType.TRANSPOSITITON_TABLE
             )
             return tt_entry["score"]  # type: ignore
 
+        # The window this node is searched with, to classify the result for the transposition table
+        original_alpha = alpha
+
         self._statistics.increment_visited(NodeTypes.QUIESCENSE)
 
         stand_pat = self._evaluator.evaluate(board)
@@ -262,52 +318,45 @@ class MiniMaxVariants(Searcher, ABC):
             alpha = stand_pat
 
         mo_heuristic = self._build_move_order_heuristic(board, depth)
-        legal_moves = MoveOrderer.order_moves(
-            mo_heuristic, (move for move in board.legal_moves if board.is_capture(move))
-        )
+        legal_moves = MoveOrderer.order_moves(mo_heuristic, board.legal_captures)
+
+        # Bind to locals once, rather than looking up attributes for every move
+        push, pop = board.push, board.pop
+        quiescence = self._quiescence
+        enable_delta_pruning = self._searcher_config.enable_delta_pruning
 
         for move in legal_moves:
             # delta pruning
-            if self._searcher_config.enable_delta_pruning and self._delta_pruning(
+            if enable_delta_pruning and self._delta_pruning(
                 board, move, stand_pat, alpha
             ):
                 self._statistics.increment_visited(PruningTypes.DELTA)
                 continue
 
-            # Get the piece from the originating square and the captured piece
-            # Existence of captured piece is guaranteed in quiescence search
-            previous_piece_from_square = (
-                board.piece_at(move.from_square) if zobrist_state else None
-            )
-            captured_piece = board.piece_at(move.to_square) if zobrist_state else None
-
-            board.push(move)
-
-            # Update the Zobrist hash
-            child_zobrist_state = (
-                self._zobrist_hash.incremental_zobrist_hash(
-                    board,
-                    move,
-                    zobrist_state,
-                    previous_piece_from_square,  # type: ignore
-                    captured_piece,
-                )
-                if zobrist_state
-                else None
-            )
-            score = -self._quiescence(
-                board, depth - 1, -beta, -alpha, child_zobrist_state
+            push(move)
+
+            # The board keeps its Zobrist hash up to date as moves are pushed
+            child_zobrist_hash = (
+                board.zobrist_hash if zobrist_hash is not None else None
             )
-            board.pop()
+            score = -quiescence(board, depth - 1, -beta, -alpha, child_zobrist_hash)
+            pop()
 
             if score >= beta:
+                if zobrist_hash is not None:
+                    self._transposition_table.store(zobrist_hash, 0, beta, Bound.LOWER)
                 return beta
 
             if score > alpha:
                 alpha = score
 
-            if zobrist_state:
-                self._transposition_table.store(zobrist_state.zobrist_hash, 0, score)
+        if zobrist_hash is not None:
+            self._transposition_table.store(
+                zobrist_hash,
+                0,
+                alpha,
+                self._transposition_table.bound(alpha, original_alpha, beta),
+            )
 
         return alpha
 
@@ -339,7 +388,7 @@ class MiniMaxVariants(Searcher, ABC):
         in_check = board.is_check()
         if depth >= depth_reduction_factor and not in_check:
             null_move_depth = depth - depth_reduction_factor
-            board.push(chess.Move.null())
+            board.push(self._NULL_MOVE)
             # TODO: check if too expensive to calculate Zobrist state here
             value = -search_func(board, null_move_depth, -beta, -alpha, None)
             board.pop()
@@ -434,7 +483,7 @@ class MiniMaxVariants(Searcher, ABC):
             else False
         )
 
-    @stopit.threading_timeoutable(default=(float("-inf"), chess.Move.null(), 0.0, 1))
+    @stopit.threading_timeoutable(default=(float("-inf"), _NULL_MOVE, 0.0, 1))
     def _timeoutable_search(
         self,
         board_to_search: Board,
@@ -470,7 +519,7 @@ class MiniMaxVariants(Searcher, ABC):
             self._log_info(elapsed, score, move, depth)
             return score, move, elapsed, 0
         except stopit.utils.TimeoutException:
-            return float("-inf"), chess.Move.null(), 0.0, 1
+            return float("-inf"), self._NULL_MOVE, 0.0, 1
         except Exception:
             raise
 
@@ -497,20 +546,28 @@ class MiniMaxVariants(Searcher, ABC):
         :rtype: Tuple[float, chess.Move]
         """
         score = -float("inf")
-        move = chess.Move.null()
+        move = self._NULL_MOVE
+        self._stoppable = False
 
         for depth in range(1, self._max_depth + 1):
-            new_board = copy.deepcopy(board)
+            new_board = board.clone()
 
             self._statistics.reset_visited()
 
             time_left = timeout
-            new_score, new_move, elapsed, error_code = self._timeoutable_search(
-                timeout=time_left,
-                board_to_search=new_board,
-                depth=depth,
-                prev_score=score,
-            )
+            try:
+                new_score, new_move, elapsed, error_code = self._timeoutable_search(
+                    timeout=time_left,
+                    board_to_search=new_board,
+                    depth=depth,
+                    prev_score=score,
+                )
+            # Stop requested mid-depth, the previous depth is the best we have.
+            except SearchStopped:
+                logging.info(
+                    f"Search stopped during depth {depth}, returning best move from depth {depth - 1}."
+                )
+                break
 
             # Timed out, return best move from previous depth.
             if error_code:
@@ -525,6 +582,11 @@ class MiniMaxVariants(Searcher, ABC):
             # Else move onto next depth, unless we have no more time already.
             else:
                 score, move = new_score, new_move
+                self._stoppable = True
+                # Stop requested, the completed depth is the best we have.
+                if self._stop_event.is_set():
+                    logging.info(f"Search stopped after depth {depth}.")
+                    break
                 if time_left is not None:
                     time_left -= elapsed
                     if time_left <= 0:  # type: ignore
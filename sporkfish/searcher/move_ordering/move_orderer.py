@@ -1,6 +1,10 @@
-from typing import Any
+from typing import Any, Iterator, Set
 
+import chess
+
+from sporkfish.board.board import Board
 from sporkfish.searcher.move_ordering.move_order_heuristic import MoveOrderHeuristic
+from sporkfish.searcher.move_ordering.mvv_lva_heuristic import MvvLvaHeuristic
 
 
 class MoveOrderer:
@@ -22,8 +26,42 @@ class MoveOrderer:
         :return: The ordered legal moves.
         :rtype: Any
         """
+        # Key on the bound method directly: no lambda frame or key tuple per move
         return sorted(
             legal_moves,
-            key=lambda move: (move_ordering_heuristic.evaluate(move),),
+            key=move_ordering_heuristic.evaluate,
             reverse=True,
         )
+
+    @staticmethod
+    def order_moves_staged(
+        mvv_lva_heuristic: MvvLvaHeuristic, board: Board
+    ) -> Iterator[chess.Move]:
+        """
+        Lazily yield the legal moves in the same order as order_moves with an MVV-LVA heuristic, generating them in stages.
+
+        Scoring captures are yielded first, from best to worst. The remaining moves all score zero,
+        so they follow in generation order, as in the stable sort. They are only generated if the
+        search asks for them, so a node which cuts off on a capture never generates its quiet moves.
+        The board must be back in the same position whenever the iterator is resumed.
+
+        :param mvv_lva_heuristic: The MVV-LVA heuristic used to evaluate captures.
+        :type mvv_lva_heuristic: MvvLvaHeuristic
+        :param board: The board to generate moves for.
+        :type board: Board
+        :return: An iterator over the ordered legal moves.
+        :rtype: Iterator[chess.Move]
+        """
+        captures = sorted(
+            board.legal_captures, key=mvv_lva_heuristic.evaluate, reverse=True
+        )
+        yielded: Set[chess.Move] = set()
+        for move in captures:
+            if not mvv_lva_heuristic.evaluate(move):
+                break
+            yielded.add(move)
+            yield move
+
+        for move in board.legal_moves:
+            if move not in yielded:
+                yield move
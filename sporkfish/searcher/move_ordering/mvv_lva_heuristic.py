@@ -1,9 +1,20 @@
+from typing import Sequence, Tuple
+
 import chess
 
 from sporkfish.board.board import Board
 from sporkfish.searcher.move_ordering.move_order_heuristic import MoveOrderHeuristic
 
 
+def _by_piece_types(table: Sequence[Sequence[int]]) -> Tuple[int, ...]:
+    # Flatten a victim by attacker table, indexed by victim piece type * 8 + attacker piece type
+    return tuple(
+        table[victim - 1][attacker - 1] if victim and 0 < attacker <= 6 else 0
+        for victim in range(7)
+        for attacker in range(8)
+    )
+
+
 class MvvLvaHeuristic(MoveOrderHeuristic):
     # Columns: attacker P, N, B, R, Q, K
     _MVV_LVA = [
@@ -14,6 +25,9 @@ class MvvLvaHeuristic(MoveOrderHeuristic):
         [55, 54, 53, 52, 51, 50],  # victim Q
         [0, 0, 0, 0, 0, 0],  # victim K
     ]
+    # The table above flattened and indexed by victim piece type * 8 + attacker piece type,
+    # so a capture is scored from the two piece type ints with a single lookup
+    _MVV_LVA_BY_PIECE_TYPES = _by_piece_types(_MVV_LVA)
 
     def __init__(self, board: Board) -> None:
         MoveOrderHeuristic.__init__(self)
@@ -30,13 +44,11 @@ class MvvLvaHeuristic(MoveOrderHeuristic):
         :rtype: float
         """
 
-        if (
-            self._board.is_capture(move)
-            and (captured_piece := self._board.piece_at(move.to_square))
-            and (moving_piece := self._board.piece_at(move.from_square))
+        board = self._board
+        # Legal moves only land on an occupied square when capturing.
+        # En passant captures land on an empty square, so score 0 as before.
+        if (victim := board.piece_type_at(move.to_square)) and (
+            attacker := board.piece_type_at(move.from_square)
         ):
-            return MvvLvaHeuristic._MVV_LVA[captured_piece.piece_type - 1][
-                moving_piece.piece_type - 1
-            ]
-        else:
-            return 0
+            return MvvLvaHeuristic._MVV_LVA_BY_PIECE_TYPES[victim << 3 | attacker]
+        return 0
@@ -8,7 +8,6 @@ from sporkfish.searcher.minimax import MiniMaxVariants
 from sporkfish.searcher.move_ordering.move_orderer import MoveOrderer
 from sporkfish.searcher.searcher_config import SearcherConfig
 from sporkfish.statistics import NodeTypes, PruningTypes, TranspositionTable
-from sporkfish.zobrist_hasher import ZobristStateInfo
 
 
 class NegamaxSp(MiniMaxVariants):
@@ -25,7 +24,7 @@ class NegamaxSp(MiniMaxVariants):
         depth: int,
         alpha: float,
         beta: float,
-        zobrist_state: Optional[ZobristStateInfo],
+        zobrist_hash: Optional[int],
     ) -> float:
         """
         Negamax implementation with alpha-beta pruning. For non-root nodes.
@@ -38,8 +37,8 @@ class NegamaxSp(MiniMaxVariants):
         :type alpha: float
         :param beta: The beta value for alpha-beta pruning.
         :type beta: float
-        :param zobrist_state: The Zobrist hash state information.
-        :type zobrist_state: Optional[ZobristStateInfo]
+        :param zobrist_hash: The Zobrist hash of the board, or None if the transposition table is disabled.
+        :type zobrist_hash: Optional[int]
 
         :returns: The evaluation score of the current board position.
         :rtype: float
@@ -50,18 +49,22 @@ class NegamaxSp(MiniMaxVariants):
         # We currently only expect max 4 captures to reach a quiet (non-capturing) position
         # This is not ideal, but otherwise the search becomes incredibly slow
         if depth == 0:
-            return self._quiescence(board, 4, alpha, beta, zobrist_state)
+            return self._quiescence(board, 4, alpha, beta, zobrist_hash)
 
         # Probe the transposition table for an existing entry
-        if zobrist_state and (
+        if zobrist_hash is not None and (
             tt_entry := self._transposition_table.probe(
-                zobrist_state.zobrist_hash, depth
+                zobrist_hash, depth, alpha, beta
             )
         ):
             # add test
             self._statistics.increment_visited(TranspositionTable.TRANSPOSITITON_TABLE)
             return tt_entry["score"]  # type: ignore
 
+        # The window this node is searched with, to classify the result for the transposition table
+        original_alpha = alpha
+
+        self._check_stop()
         self._statistics.increment_visited(NodeTypes.NEGAMAX)
 
         # Null move pruning - reduce the search space by trying a null move,
@@ -74,55 +77,38 @@ class NegamaxSp(MiniMaxVariants):
             return beta
 
         # Move ordering
-        mo_heuristic = self._build_move_order_heuristic(board, depth)
-        legal_moves = MoveOrderer.order_moves(mo_heuristic, board.legal_moves)
+        legal_moves = self._order_moves(board, depth)
+
+        # Bind to locals once, rather than looking up attributes for every move
+        push, pop = board.push, board.pop
+        negamax = self._negamax
+        enable_futility_pruning = self._searcher_config.enable_futility_pruning
 
         # Recursive search with alpha-beta pruning
         for move in legal_moves:
-            # Get captures for futility pruning or transposition table
-            # Get piece at previous from_square for transposition table
+            # Get captures for futility pruning
             # This needs to be done prior to changing the board state
-            previous_piece_from_square = (
-                board.piece_at(move.from_square) if zobrist_state else None
-            )
-            capture = (
-                board.is_capture(move)
-                if self._searcher_config.enable_futility_pruning or zobrist_state
-                else False
-            )
-            captured_piece = (
-                board.piece_at(move.to_square) if zobrist_state and capture else None
-            )
+            capture = board.is_capture(move) if enable_futility_pruning else False
 
-            board.push(move)
+            push(move)
 
             # Futility pruning
-            if self._searcher_config.enable_futility_pruning and self._futility_pruning(
+            if enable_futility_pruning and self._futility_pruning(
                 board, depth, capture, move, alpha
             ):
-                board.pop()
+                pop()
                 # add test
                 self._statistics.increment_visited(PruningTypes.FUTILITY)
                 continue
 
-            # Update the Zobrist hash
-            child_zobrist_state = (
-                self._zobrist_hash.incremental_zobrist_hash(
-                    board,
-                    move,
-                    zobrist_state,
-                    previous_piece_from_square,  # type: ignore
-                    captured_piece,
-                )
-                if zobrist_state
-                else None
+            # The board keeps its Zobrist hash up to date as moves are pushed
+            child_zobrist_hash = (
+                board.zobrist_hash if zobrist_hash is not None else None
             )
 
-            child_value = -self._negamax(
-                board, depth - 1, -beta, -alpha, child_zobrist_state
-            )
+            child_value = -negamax(board, depth - 1, -beta, -alpha, child_zobrist_hash)
 
-            board.pop()
+            pop()
 
             value = max(value, child_value)
             alpha = max(alpha, value)
@@ -133,8 +119,13 @@ class NegamaxSp(MiniMaxVariants):
                 self._update_history_table(move, depth)
                 break
 
-        if zobrist_state:
-            self._transposition_table.store(zobrist_state.zobrist_hash, depth, value)
+        if zobrist_hash is not None:
+            self._transposition_table.store(
+                zobrist_hash,
+                depth,
+                value,
+                self._transposition_table.bound(value, original_alpha, beta),
+            )
 
         return value
 
@@ -161,44 +152,26 @@ class NegamaxSp(MiniMaxVariants):
         :rtype: Tuple[float, chess.Move]
         """
         value = -float("inf")
-        best_move = chess.Move.null()
+        best_move = self._NULL_MOVE
 
-        zobrist_state = (
-            self._zobrist_hash.full_zobrist_hash(board)
+        zobrist_hash = (
+            board.zobrist_hash
             if self._searcher_config.enable_transposition_table
             else None
         )
+        original_alpha = alpha
         mo_heuristic = self._build_move_order_heuristic(board, depth)
         legal_moves = MoveOrderer.order_moves(mo_heuristic, board.legal_moves)
 
         for move in legal_moves:
-            # Get piece at from_square and captures for transposition table
-            # This needs to be done prior to changing the board state
-            previous_piece_from_square = (
-                board.piece_at(move.to_square) if zobrist_state else None
-            )
-            captured_piece = (
-                board.piece_at(move.to_square)
-                if zobrist_state and board.is_capture(move)
-                else None
-            )
-
             board.push(move)
 
-            # Update the Zobrist hash
-            child_zobrist_state = (
-                self._zobrist_hash.incremental_zobrist_hash(
-                    board,
-                    move,
-                    zobrist_state,
-                    previous_piece_from_square,  # type: ignore
-                    captured_piece,
-                )
-                if zobrist_state
-                else None
+            # The board keeps its Zobrist hash up to date as moves are pushed
+            child_zobrist_hash = (
+                board.zobrist_hash if zobrist_hash is not None else None
             )
             child_value = -self._negamax(
-                board, depth - 1, -beta, -alpha, child_zobrist_state
+                board, depth - 1, -beta, -alpha, child_zobrist_hash
             )
 
             board.pop()
@@ -213,8 +186,13 @@ class NegamaxSp(MiniMaxVariants):
                 self._statistics.increment_visited(PruningTypes.ALPHA_BETA)
                 break
 
-        if zobrist_state:
-            self._transposition_table.store(zobrist_state.zobrist_hash, depth, value)
+        if zobrist_hash is not None:
+            self._transposition_table.store(
+                zobrist_hash,
+                depth,
+                value,
+                self._transposition_table.bound(value, original_alpha, beta),
+            )
 
         return value, best_move
 
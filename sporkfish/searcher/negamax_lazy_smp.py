@@ -12,6 +12,9 @@ from sporkfish.searcher.searcher_config import SearcherConfig
 
 # This doesn't really work yet. Don't use.
 class NegaMaxLazySmp(NegamaxSp):
+    # Extra depth searched by each process, cycled through, so processes diverge instead of duplicating work
+    _DEPTH_OFFSETS = (0, 1, 1, 2)
+
     def __init__(
         self,
         evaluator: Evaluator,
@@ -46,22 +49,29 @@ class NegaMaxLazySmp(NegamaxSp):
         :rtype: Tuple[float, chess.Move]
         """
 
-        def task() -> Tuple[float, chess.Move]:
+        def task(board: Board, depth: int) -> Tuple[float, chess.Move]:
             # TODO: fix increment statistics
             return NegamaxSp._start_search_from_root(self, board, depth, alpha, beta)
 
         # Let processes race down lazily and see who completes first
-        # We need to add more asymmetry but a task for later
+        # Each process gets its own cheap clone of the board (no move history to serialise)
+        # and some search deeper, for asymmetry, though never past the depth the killer table is sized for
         futures = []
         for i in range(self._num_processes):  # type: ignore
-            futures.append(self._pool.apipe(task))
+            depth_offset = self._DEPTH_OFFSETS[i % len(self._DEPTH_OFFSETS)]
+            worker_depth = min(depth + depth_offset, self._max_depth)
+            futures.append(
+                (worker_depth, self._pool.apipe(task, board.clone(), worker_depth))
+            )
 
         while True:
-            for future in futures:
-                if future.ready():
-                    res: Tuple[float, chess.Move] = future.get()
-                    return res
-            else:
-                # Continue the loop if no result is ready yet
-                # Busy waiting is fine here because in principle, nothing else needs to be done
-                continue
+            # Of the processes finished so far, the deepest search is the most accurate
+            finished = [(d, future) for d, future in futures if future.ready()]
+            if finished:
+                _, deepest = max(
+                    finished, key=lambda finished_future: finished_future[0]
+                )
+                res: Tuple[float, chess.Move] = deepest.get()
+                return res
+            # Continue the loop if no result is ready yet
+            # Busy waiting is fine here because in principle, nothing else needs to be done
@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple
 
@@ -9,6 +10,12 @@ from sporkfish.searcher.searcher_config import SearcherConfig
 from sporkfish.statistics import Statistics
 
 
+class SearchStopped(Exception):
+    """
+    Raised from within a search to unwind it, once a stop has been requested.
+    """
+
+
 class Searcher(ABC):
     """
     Dynamic best move searching class.
@@ -25,6 +32,27 @@ class Searcher(ABC):
         self._searcher_config = searcher_config
         self._statistics = Statistics()
         self._dict: dict = dict()
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Request that the current search stops as soon as possible.
+        Safe to call from another thread, e.g. the UCI stdin reader.
+        """
+        self._stop_event.set()
+
+    def reset_stop(self) -> None:
+        """
+        Withdraw any stop requested earlier, ahead of a new search.
+        Searches never do this themselves, so that a stop requested before one starts is still honoured.
+        """
+        self._stop_event.clear()
+
+    def new_game(self) -> None:
+        """
+        Forget what was learned while searching previous games, which may no longer be reachable.
+        """
+        self._dict.clear()
 
     def _log_info(
         self, elapsed: float, score: float, move: chess.Move, depth: int
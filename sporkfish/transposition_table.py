@@ -1,52 +1,104 @@
-from typing import Dict, Optional
+from enum import Enum, auto
+from typing import Any, Dict, Optional
 
-import numpy as np
+
+class Bound(Enum):
+    """How a stored score relates to the true score of the position."""
+
+    EXACT = auto()
+    # The search failed high, so the true score is at least the stored score
+    LOWER = auto()
+    # The search failed low, so the true score is at most the stored score
+    UPPER = auto()
 
 
 class TranspositionTable:
-    def __init__(self, dct: Dict[np.int64, Dict[str, float]]) -> None:
+    def __init__(self, dct: Dict[int, Dict[str, Any]]) -> None:
         """
         Initialize the TranspositionTable object.
 
         :param dct: A dictionary containing Zobrist hash keys and associated entries.
-        :type dct: Dict[np.int64, Dict[str, float]]
+        :type dct: Dict[int, Dict[str, Any]]
         """
         self._table = dct
 
+    @staticmethod
+    def bound(score: float, alpha: float, beta: float) -> Bound:
+        """
+        Classify a search result against the window it was searched with.
+
+        :param score: The score returned by the search.
+        :type score: float
+        :param alpha: The lower bound of the search window.
+        :type alpha: float
+        :param beta: The upper bound of the search window.
+        :type beta: float
+
+        :return: The type of bound the score is on the true score.
+        :rtype: Bound
+        """
+        if score <= alpha:
+            return Bound.UPPER
+        if score >= beta:
+            return Bound.LOWER
+        return Bound.EXACT
+
     def store(
         self,
-        zobrist_hash: np.int64,
+        zobrist_hash: int,
         depth: int,
         score: float,
+        bound: Bound = Bound.EXACT,
     ) -> None:
         """
         Store an entry in the transposition table.
-        Only stores if the existing entry depth is lower than the input one.
+        Only stores if the existing entry depth is not higher than the input one.
 
         :param zobrist_hash: The Zobrist hash value for the board position.
-        :type zobrist_hash: np.int64
+        :type zobrist_hash: int
         :param depth: The depth at which the score was calculated.
         :type depth: int
         :param score: The score associated with the board position.
         :type score: float
+        :param bound: The type of bound the score is on the true score.
+        :type bound: Bound
         """
         existing_entry = self._table.get(zobrist_hash)
-        if not existing_entry or depth > existing_entry["depth"]:
-            self._table[zobrist_hash] = {"depth": depth, "score": score}
+        if not existing_entry or depth >= existing_entry["depth"]:
+            self._table[zobrist_hash] = {"depth": depth, "score": score, "bound": bound}
 
-    def probe(self, zobrist_hash: np.int64, depth: int) -> Optional[Dict]:
+    def probe(
+        self,
+        zobrist_hash: int,
+        depth: int,
+        alpha: float = float("-inf"),
+        beta: float = float("inf"),
+    ) -> Optional[Dict]:
         """
-        Retrieve an entry from the transposition table, if the existing entry depth is larger than the input one.
+        Retrieve an entry from the transposition table, if the existing entry depth is at least the input one
+        and its score can be used for the given search window.
 
         :param zobrist_hash: The Zobrist hash value for the board position.
-        :type zobrist_hash: np.int64
+        :type zobrist_hash: int
         :param depth: The depth at which the score is needed.
         :type depth: int
+        :param alpha: The lower bound of the search window.
+        :type alpha: float
+        :param beta: The upper bound of the search window.
+        :type beta: float
 
-        :return: The stored entry if found, or None if not found or the depth is insufficient.
+        :return: The stored entry if found, or None if not found, the depth is insufficient
+                 or the stored bound does not decide the search window.
         :rtype: Optional[Dict]
         """
         entry = self._table.get(zobrist_hash, None)
-        if entry and entry["depth"] >= depth:
+        if not entry or entry["depth"] < depth:
+            return None
+        bound = entry["bound"]
+        if (
+            bound is Bound.EXACT
+            or (bound is Bound.LOWER and entry["score"] >= beta)
+            or (bound is Bound.UPPER and entry["score"] <= alpha)
+        ):
             return entry
         return None
@@ -1,6 +1,7 @@
 import logging
 import sys
 from enum import Enum, auto
+from typing import Callable, Dict, List, Optional
 
 from config import load_config
 from sporkfish.board.board import Board
@@ -28,6 +29,12 @@ class UCIClient:
     Methods:
     - send_command(command: str) -> str:
         Send a command to the UCI engine and return the response.
+    - stop() -> None:
+        Stop the engine's current search.
+    - reset_stop() -> None:
+        Withdraw any stop requested earlier, ahead of a new search.
+    - close() -> None:
+        Release what the engine holds, once no more commands will be sent.
 
     Properties:
     - engine: Get the chess engine instance.
@@ -62,6 +69,7 @@ class UCIClient:
         - "uci": Returns information about the engine.
         - "quit": Exits the engine.
         - "isready": Signals readiness of the engine.
+        - "ucinewgame": Prepares the engine and board for a new game.
         - "position startpos ...": Sets up the board with the starting position.
         - "position moves ...": Updates the board with the specified moves.
         - "go ...": Initiates the engine to search for the best move.
@@ -78,6 +86,22 @@ class UCIClient:
 
         def __init__(self, response_mode: ResponseMode = ResponseMode.PRINT) -> None:
             self._response_mode = response_mode
+            # Handler for each supported command, looked up by the first token of a message
+            self._handlers: Dict[
+                str, Callable[[List[str], Board, Engine, TimeManager], str]
+            ] = {
+                "uci": self._uci,
+                "quit": self._quit,
+                "isready": self._isready,
+                "ucinewgame": self._ucinewgame,
+                "position": self._position,
+                "go": self._go,
+            }
+            # Moves applied from startpos by the last "position" (and any "go" after it),
+            # and the hash of the position they led to, so that the next "position" only
+            # replays the moves played since
+            self._moves: List[str] = []
+            self._moves_hash: Optional[int] = None
 
         def communicate(
             self,
@@ -89,7 +113,7 @@ class UCIClient:
             """
             Process a UCI command and respond accordingly.
             This currently only implements a subset of the full UCI commands. Commands implemented:
-            "uci", "quit", "isready", "position startpos ...", "position moves ...", "go ..."
+            "uci", "quit", "isready", "ucinewgame", "position startpos ...", "position moves ...", "go ..."
 
             :param msg: The UCI command received.
             :type msg: str
@@ -103,67 +127,127 @@ class UCIClient:
             :return: The UCI response if response_mode is ResponseMode.RETURN.
             :rtype: str
             """
-            tokens = msg.strip().split(" ")
-            while "" in tokens:
-                tokens.remove("")
-
-            response = ""
-
-            if msg == "uci":
-                response = "id name Sporkfish\nid author Sporkfish dev team\nuciok"
-
-            elif msg == "quit":
-                sys.exit()
-
-            elif msg == "isready":
-                response = "readyok"
-
-            elif msg.startswith("position"):
-                if len(tokens) < 2:
-                    return ""
-
-                if tokens[1] == "startpos":
-                    board.reset()
-                    moves_start = 2
-
-                if len(tokens) > moves_start and tokens[moves_start] == "moves":
-                    for move in tokens[(moves_start + 1) :]:
-                        board.push_uci(move)
-
-            elif msg.startswith("go"):
-                tokens = msg.split()
-                idx = 1
-                timeout = None
-
-                # Get the time and increment
-                while idx < len(tokens):
-                    # Assumes increment comes straight after time
-                    if tokens[idx] == "wtime" or tokens[idx] == "btime":
-                        assert (
-                            len(tokens) >= idx + 3
-                        ), "wtime or btime given in go string but no time or increment values passed."
-                        # Convert to ms -> s
-                        time = float(tokens[idx + 1]) / 1000.0
-                        increment = float(tokens[idx + 3]) / 1000.0
-                        timeout = time_manager.get_timeout(time, increment)
-                        break
-                    idx += 1
-
-                move = engine.best_move(board, timeout)  # type: ignore
-                board.push(move)  # type: ignore
-                response = f"bestmove {move}" or "(none)"
+            # split() with no separator already drops empty tokens from repeated whitespace
+            tokens = msg.split()
+            handler = self._handlers.get(tokens[0]) if tokens else None
+            response = handler(tokens, board, engine, time_manager) if handler else ""
 
             if response:
                 logging.info(f"UCI Response: {response}")
 
             if self._response_mode == UCIClient.UCIProtocol.ResponseMode.PRINT:
-                print(response)
+                # Flush each response, as stdout is block buffered when piped to a GUI
+                if response:
+                    sys.stdout.write(f"{response}\n")
+                    sys.stdout.flush()
             elif self._response_mode == UCIClient.UCIProtocol.ResponseMode.RETURN:
                 return response
 
             # Return an empty string for unrecognized commands or cases where no response is needed
             return ""
 
+        def _uci(
+            self,
+            tokens: List[str],
+            board: Board,
+            engine: Engine,
+            time_manager: TimeManager,
+        ) -> str:
+            return "id name Sporkfish\nid author Sporkfish dev team\nuciok"
+
+        def _quit(
+            self,
+            tokens: List[str],
+            board: Board,
+            engine: Engine,
+            time_manager: TimeManager,
+        ) -> str:
+            sys.exit()
+
+        def _isready(
+            self,
+            tokens: List[str],
+            board: Board,
+            engine: Engine,
+            time_manager: TimeManager,
+        ) -> str:
+            return "readyok"
+
+        def _ucinewgame(
+            self,
+            tokens: List[str],
+            board: Board,
+            engine: Engine,
+            time_manager: TimeManager,
+        ) -> str:
+            engine.new_game()
+            board.reset()
+            self._moves = []
+            self._moves_hash = None
+            return ""
+
+        def _position(
+            self,
+            tokens: List[str],
+            board: Board,
+            engine: Engine,
+            time_manager: TimeManager,
+        ) -> str:
+            # Only positions from startpos are supported
+            if len(tokens) < 2 or tokens[1] != "startpos":
+                return ""
+
+            moves = tokens[3:] if len(tokens) > 2 and tokens[2] == "moves" else []
+            num_applied = len(self._moves)
+            if (
+                board.zobrist_hash == self._moves_hash
+                and moves[:num_applied] == self._moves
+            ):
+                new_moves = moves[num_applied:]
+            else:
+                board.reset()
+                new_moves = moves
+
+            self._moves_hash = None
+            for move in new_moves:
+                board.push_uci(move)
+            self._moves = moves
+            self._moves_hash = board.zobrist_hash
+            return ""
+
+        def _go(
+            self,
+            tokens: List[str],
+            board: Board,
+            engine: Engine,
+            time_manager: TimeManager,
+        ) -> str:
+            idx = 1
+            timeout = None
+
+            # Get the time and increment
+            while idx < len(tokens):
+                # Assumes increment comes straight after time
+                if tokens[idx] == "wtime" or tokens[idx] == "btime":
+                    assert (
+                        len(tokens) >= idx + 3
+                    ), "wtime or btime given in go string but no time or increment values passed."
+                    # Convert to ms -> s
+                    time = float(tokens[idx + 1]) / 1000.0
+                    increment = float(tokens[idx + 3]) / 1000.0
+                    timeout = time_manager.get_timeout(time, increment)
+                    break
+                idx += 1
+
+            best_move = engine.best_move(board, timeout)
+            continues_moves = board.zobrist_hash == self._moves_hash
+            board.push(best_move)
+            uci = board.uci(best_move)
+            if continues_moves:
+                self._moves.append(uci)
+                self._moves_hash = board.zobrist_hash
+            return f"bestmove {uci}"
+
     def __init__(self, response_mode: UCIProtocol.ResponseMode) -> None:
         """
         Initialize the UCIClient with the specified response mode.
@@ -198,6 +282,24 @@ class UCIClient:
             command, self._board, self._engine, self._time_manager
         )
 
+    def stop(self) -> None:
+        """
+        Stop the engine's current search. May be called while another thread is searching.
+        """
+        self._engine.stop()
+
+    def close(self) -> None:
+        """
+        Release what the engine holds, once no more commands will be sent.
+        """
+        self._engine.close()
+
+    def reset_stop(self) -> None:
+        """
+        Withdraw any stop requested earlier, ahead of a new search. May be called from another thread.
+        """
+        self._engine.reset_stop()
+
     @property
     def engine(self) -> Engine:
         """
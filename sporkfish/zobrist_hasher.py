@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 import chess
 import numpy as np
@@ -24,6 +24,12 @@ _CASTLING_KEYS = np.random.randint(
     _INT64_MIN_VAL, _INT64_MAX_VAL, size=16, dtype=np.int64
 )
 
+# Plain int copies of the keys, for hashing in pure Python where numpy scalars are slow
+PIECE_KEYS: List[List[int]] = _PIECE_KEYS.tolist()
+TURN_KEY = int(_TURN_KEY)
+EN_PASSANT_KEYS: List[int] = _EN_PASSANT_KEYS.tolist()
+CASTLING_KEYS: List[int] = _CASTLING_KEYS.tolist()
+
 
 @njit(cache=True, nogil=True)
 def _aggregate_piece_hash(
@@ -1,5 +1,7 @@
 import chess
+import pytest
 
+from sporkfish.board.board_factory import BoardFactory
 from sporkfish.board.board_py_chess import BoardPyChess
 
 
@@ -14,3 +16,142 @@ class TestBoardPyChess:
         assert chess.Move.from_uci("d2d4") in [
             chess.Move.from_uci(move.uci()) for move in board.legal_moves
         ]
+
+    def test_bitboards(self):
+        board = BoardPyChess()
+        assert chess.popcount(board.occupied) == 32
+        assert board.occupied_co(chess.WHITE) == chess.BB_RANK_1 | chess.BB_RANK_2
+        assert board.pieces_mask(chess.KING, chess.BLACK) == chess.BB_E8
+        board.push_uci("e2e4")
+        assert board.pieces_mask(chess.PAWN, chess.WHITE) & chess.BB_E4
+        assert not board.occupied & chess.BB_E2
+
+    def test_legal_moves_cached(self):
+        board = BoardPyChess()
+        moves = board.legal_moves
+        assert board.legal_moves is moves
+        board.push_uci("e2e4")
+        assert board.legal_moves == list(board.board.legal_moves)
+        board.push_uci("d7d5")
+        assert board.legal_captures == [chess.Move.from_uci("e4d5")]
+        board.pop()
+        board.pop()
+        assert board.legal_moves is moves
+        board.set_fen("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 2")
+        assert board.legal_captures == [chess.Move.from_uci("e5d6")]
+
+    def test_piece_at(self):
+        board = BoardPyChess()
+        for square in chess.SQUARES:
+            assert board.piece_at(square) == board.board.piece_at(square)
+        assert board.piece_at(chess.A1) is board.piece_at(chess.H1)
+        assert board.piece_at(chess.E4) is None
+        # Pieces compare by value, and unequal to other types rather than raising
+        assert board.piece_at(chess.E1) == chess.Piece(chess.KING, chess.WHITE)
+        assert board.piece_at(chess.E1) != chess.KING
+
+    def test_piece_type_at(self):
+        board = BoardPyChess()
+        board.push_uci("e2e4")
+        for square in chess.SQUARES:
+            piece = board.piece_at(square)
+            assert board.piece_type_at(square) == (piece.piece_type if piece else None)
+
+    def test_piece_array(self):
+        board = BoardPyChess()
+        board.push_uci("e2e4")
+        board.push_uci("d7d5")
+        pieces = board.piece_array()
+        for square in chess.SQUARES:
+            piece = board.piece_at(square)
+            expected = (
+                (piece.piece_type if piece.color else -piece.piece_type) if piece else 0
+            )
+            assert pieces[square] == expected
+        assert board.piece_array() is pieces
+        board.push_uci("e4d5")
+        assert board.piece_array()[chess.D5] == chess.PAWN
+        board.pop()
+        assert board.piece_array() is pieces
+
+    def test_piece_array_incremental(self):
+        board = BoardPyChess()
+        # Castling both ways, en passant and promotions available
+        board.set_fen(
+            "r3k2r/pPppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+        )
+        board.piece_array()
+        for move in board.legal_moves:
+            board.push(move)
+            board.piece_array()
+            for reply in board.legal_moves:
+                board.push(reply)
+                expected = BoardPyChess()
+                expected.set_fen(board.fen())
+                assert (board.piece_array() == expected.piece_array()).all()
+                board.pop()
+            board.pop()
+
+    def test_push_uci(self):
+        board = BoardPyChess()
+        board.set_fen("r3k2r/1P6/8/8/8/8/8/R3K2R w KQkq - 0 1")
+        for uci in ("b7a8n", "e8g8", "e1c1", "0000"):
+            board.push_uci(uci)
+            assert board.board.peek() == chess.Move.from_uci(uci)
+        for uci in ("a1a1", "b7b8x", "e2e4", "e1g1q"):
+            with pytest.raises(ValueError):
+                board.push_uci(uci)
+
+    def test_is_check_cached(self):
+        board = BoardPyChess()
+        for uci in ("e2e4", "f7f6", "d2d4", "g7g5"):
+            board.push_uci(uci)
+            assert not board.is_check()
+        board.push_uci("d1h5")
+        assert board.is_check()
+        board.pop()
+        assert not board.is_check()
+        board.set_fen("4k3/8/8/8/8/8/8/4K2q w - - 0 1")
+        assert board.is_check()
+
+    def test_clone(self):
+        board = BoardPyChess()
+        board.push_uci("e2e4")
+        board.legal_moves
+        clone = board.clone()
+        assert clone.fen() == board.fen()
+        assert clone.zobrist_hash == board.zobrist_hash
+        clone.push_uci("e7e5")
+        assert board.fen() != clone.fen()
+        clone.pop()
+        assert clone.fen() == board.fen()
+        assert clone.legal_moves == board.legal_moves
+        with pytest.raises(IndexError):
+            clone.pop()
+        board.pop()
+        assert board.fen() == chess.STARTING_FEN
+
+    def test_uci(self):
+        board = BoardPyChess()
+        for uci in ("e2e4", "g1f3", "a7a8q", "h2h1n", "e1g1"):
+            assert board.uci(chess.Move.from_uci(uci)) == uci
+        assert board.uci(chess.Move.null()) == "0000"
+
+    def test_set_epd(self):
+        board = BoardPyChess()
+        epd = '1k1r4/pp1b1R2/3q2pp/4p3/2B5/4Q3/PPP2B2/2K5 b - - bm Qd1+; id "BK.01";'
+        epd_info = board.set_epd(epd)
+        expected = chess.Board()
+        assert epd_info == expected.set_epd(epd)
+        assert board.fen() == expected.fen()
+        board.set_epd("4k3/8/8/8/8/8/8/4K3 w - - hmvc 7; fmvn 30;")
+        assert board.fen() == "4k3/8/8/8/8/8/8/4K3 w - - 7 30"
+
+
+class TestBoardFactory:
+    def test_create(self):
+        assert isinstance(BoardFactory.create(BoardPyChess), BoardPyChess)
+        with pytest.raises(TypeError):
+            BoardFactory.create(chess.Board)
+        with pytest.raises(TypeError):
+            BoardFactory.create([])
@@ -1,8 +1,14 @@
+import os
+
 import pytest
 
-from config import load_config
+from config import _CONFIG_CACHE_PATH, load_config
+from sporkfish.endgame_tablebases.endgame_tablebase_config import (
+    EndgameTablebaseConfig,
+)
 from sporkfish.searcher.move_ordering.move_order_config import MoveOrderMode
 from sporkfish.searcher.searcher_config import SearcherConfig, SearchMode
+from sporkfish.time_manager import TimeManagerConfig
 
 
 def test_load_config():
@@ -10,12 +16,33 @@ def test_load_config():
     assert "RunConfig" in cfg
 
 
+def test_load_config_cached():
+    cfg = load_config.__wrapped__()
+    assert os.path.exists(_CONFIG_CACHE_PATH)
+    # Second load is served from the pickled cache
+    assert load_config.__wrapped__() == cfg
+
+
 def test_create_from_yaml_config():
     cfg = load_config()
     searcher_cfg = SearcherConfig.from_dict(cfg.get("SearcherConfig"))
     assert isinstance(searcher_cfg.max_depth, int)
 
 
+def test_yaml_round_trip():
+    cfg = TimeManagerConfig(time_weight=0.2, increment_weight=0.05)
+    round_tripped = TimeManagerConfig.from_yaml(cfg.to_yaml())
+    assert isinstance(round_tripped, TimeManagerConfig)
+    assert vars(round_tripped) == vars(cfg)
+
+
+def test_slotted_config_attributes():
+    cfg = EndgameTablebaseConfig("data/endgame_tablebases")
+    assert not hasattr(cfg, "__dict__")
+    assert cfg._public_attrs() == ("endgame_tablebase_path", "endgame_tablebase_mode")
+    assert EndgameTablebaseConfig._public_attrs() is cfg._public_attrs()
+
+
 @pytest.mark.parametrize(
     ("max_depth", "search_mode", "enable_tt", "move_order_config"),
     [
@@ -1,4 +1,10 @@
+import concurrent.futures
+import threading
+from unittest import mock
+
+import chess
 import pytest
+import requests
 from init_board_helper import board_setup
 from perf_helper import run_perf_analytics
 
@@ -49,6 +55,120 @@ class TestLocalTablebase:
     def test_et_query(self, test_name: str, fen: str, move_expected: bool):
         self._check_et_query_move_expected(test_name, fen, move_expected)
 
+    def test_tablebase_loaded_once(self):
+        config = EndgameTablebaseConfig("data/endgame_tablebases")
+        et = LocalTablebase(config)
+        assert et._db is not None
+        assert LocalTablebase(config)._db is et._db
+        assert CompositeTablebase(config)._db is et._db
+
+    def test_should_query(self):
+        et = LocalTablebase(EndgameTablebaseConfig())
+        board = BoardPyChess()
+        assert not et._should_query(board)
+        board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+        assert et._should_query(board)
+        assert not et._should_query(board, max_syzygy_size=3)
+        for fen, expected in (
+            ("8/4k3/8/8/8/8/8/3K4 w - - 0 1", False),
+            ("8/4k3/8/8/8/8/3B4/3K4 w - - 0 1", False),
+            ("8/4k3/8/8/8/8/3n4/3K4 w - - 0 1", False),
+            ("8/4k3/8/8/8/8/3R4/3K4 w - - 0 1", True),
+            ("8/4k3/8/8/8/8/3p4/3K4 w - - 0 1", True),
+            ("8/4k3/8/8/8/8/3B4/2BK4 w - - 0 1", False),
+            ("8/4k3/8/8/8/8/3B4/2bK4 w - - 0 1", False),
+            ("8/4k3/8/8/8/8/3N4/2NK4 w - - 0 1", True),
+        ):
+            board.set_fen(fen)
+            assert et._should_query(board) is expected
+
+    @pytest.mark.parametrize(
+        "fen",
+        [
+            "8/4k3/8/8/8/8/3BB3/3K4 b - - 12 40",
+            "r3k2r/8/8/3pP3/8/8/8/R3K2R w Kq d6 0 2",
+        ],
+    )
+    def test_copy_to_scratch(self, fen: str):
+        et = LocalTablebase(EndgameTablebaseConfig())
+        board = BoardPyChess()
+        board.set_fen(fen)
+        scratch = et._copy_to_scratch(board)
+        assert scratch.epd() == board.board.epd()
+        assert not scratch.move_stack
+        assert et._copy_to_scratch(board) is scratch
+        # Other threads copy onto their own scratch board
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(et._copy_to_scratch, board).result()
+        assert other is not scratch
+        assert other.epd() == scratch.epd()
+
+    def test_rank(self):
+        et = LocalTablebase(EndgameTablebaseConfig())
+        category = LocalTablebase._DTZCategory
+        for dtz, expected in (
+            (-1000, category.BLESSED_LOSS),
+            (-101, category.BLESSED_LOSS),
+            (-100, category.UNCONDITIONAL_LOSS),
+            (-1, category.UNCONDITIONAL_LOSS),
+            (0, category.UNCONDITIONAL_DRAW),
+            (1, category.UNCONDITIONAL_WIN),
+            (100, category.UNCONDITIONAL_WIN),
+            (101, category.CURSED_WIN),
+            (1000, category.CURSED_WIN),
+        ):
+            assert et._rank(dtz)[0] == expected
+            assert not isinstance(et._rank(dtz)[0], category)
+        # Wins rank higher the quicker they are, and losses the longer they are
+        assert et._rank(3) > et._rank(5)
+        assert et._rank(-5) > et._rank(-3)
+
+    def test_query_stops_at_best_rank(self):
+        board = BoardPyChess()
+        board.set_fen("8/8/8/8/6B1/4B2K/8/7k w - - 0 1")
+        et = LocalTablebase(EndgameTablebaseConfig("data/endgame_tablebases"))
+        assert et.query(board) == chess.Move.from_uci("g4f3")
+        # Moves after the winning one are never probed
+        assert len(et._dtz_cache) < len(board.legal_moves)
+
+    def test_query_restores_board(self):
+        board = BoardPyChess()
+        board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+        board.push_uci("d1c1")
+        board.push_uci("e7e6")
+        fen, zobrist_hash = board.fen(), board.zobrist_hash
+        et = LocalTablebase(EndgameTablebaseConfig("data/endgame_tablebases"))
+        assert et.query(board)
+        assert board.fen() == fen
+        assert board.zobrist_hash == zobrist_hash
+        assert len(board.board.move_stack) == 2
+
+    def test_query_ranks_draws(self):
+        board = BoardPyChess()
+        board.set_fen("2B5/8/3B4/8/8/8/8/5K1k w - - 0 1")
+        et = LocalTablebase(EndgameTablebaseConfig("data/endgame_tablebases"))
+        move = et.query(board)
+        assert move != chess.Move.from_uci("c8d7")
+        # Stalemating has a DTZ of 0, which is ranked as a draw rather than dropped
+        board.push_uci("c8d7")
+        key = board.board._transposition_key()
+        assert et._dtz_cache[key] == (LocalTablebase._DTZCategory.UNCONDITIONAL_DRAW, 0)
+        board.pop()
+        # A drawn move is returned, where losses are left to the search
+        et._dtz_cache.clear()
+        with mock.patch.object(et._db, "get_dtz", return_value=0):
+            assert et.query(board) in board.legal_moves
+
+    def test_dtz_cache(self):
+        board = BoardPyChess()
+        board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+        et = LocalTablebase(EndgameTablebaseConfig("data/endgame_tablebases"))
+        move = et.query(board)
+        assert len(et._dtz_cache) == len(board.legal_moves)
+        # The second query is answered from the cache without probing
+        with mock.patch.object(et._db, "get_dtz", side_effect=AssertionError):
+            assert et.query(board) == move
+
     def test_2nd_probe(self):
         board = BoardPyChess()
         board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
@@ -90,6 +210,101 @@ class TestLilaEndgameTablebase:
         lila_bestmove = LilaTablebase().query(board)
         assert lila_bestmove
 
+    def test_lila_skips_uncovered_positions(self):
+        et = LilaTablebase()
+        with mock.patch.object(et._session, "get", side_effect=AssertionError):
+            assert et.query(BoardPyChess()) is None
+
+    def test_lila_cache(self):
+        board = BoardPyChess()
+        board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+        et = LilaTablebase()
+        response = mock.Mock()
+        response.json.return_value = {"dtz": 1, "moves": [{"uci": "d2c3"}]}
+        with mock.patch.object(et._session, "get", return_value=response) as get:
+            assert et.query(board) == chess.Move.from_uci("d2c3")
+            # The same position with other move counters is answered from the cache
+            board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 4 9")
+            assert et.query(board) == chess.Move.from_uci("d2c3")
+            assert get.call_count == 1
+            get.assert_called_once_with(
+                LilaTablebase.BASE_URL + "8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1",
+                timeout=LilaTablebase.TIMEOUT_SECONDS,
+            )
+
+    def test_lila_prefetch(self):
+        board = BoardPyChess()
+        board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+        et = LilaTablebase()
+        response = mock.Mock()
+        response.json.return_value = {"dtz": 1, "moves": [{"uci": "e7e6"}]}
+        move = chess.Move.from_uci("d1c1")
+        with mock.patch.object(et._session, "get", return_value=response) as get:
+            et.prefetch(board, move)
+            et._prefetcher.shutdown(wait=True)
+            assert board.fen() == "8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1"
+            assert get.call_count == LilaTablebase.MAX_PREFETCHED_REPLIES
+            # A prefetched reply is answered from the cache
+            board.push(move)
+            board.push_uci("e7d6")
+            assert et.query(board) == chess.Move.from_uci("e7e6")
+            assert get.call_count == LilaTablebase.MAX_PREFETCHED_REPLIES
+
+    def test_lila_prefetch_failure(self):
+        board = BoardPyChess()
+        board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+        et = LilaTablebase()
+        response = mock.Mock()
+        response.json.return_value = {"dtz": 1, "moves": [{"uci": "d2c3"}]}
+        with mock.patch.object(
+            et._session, "get", side_effect=requests.exceptions.ConnectionError
+        ):
+            et.prefetch(board, chess.Move.from_uci("d1c1"))
+            et._prefetcher.shutdown(wait=True)
+        # A failed prefetch does not stop the position played being queried
+        with mock.patch.object(et._session, "get", return_value=response):
+            assert et.query(board) == chess.Move.from_uci("d2c3")
+
+    def test_lila_close(self):
+        board = BoardPyChess()
+        board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+        et = LilaTablebase()
+        released = threading.Event()
+
+        def get(*args, **kwargs):
+            released.wait()
+            raise requests.exceptions.ConnectionError
+
+        with mock.patch.object(et._session, "get", side_effect=get) as mock_get:
+            et.prefetch(board, chess.Move.from_uci("d1c1"))
+            # Prefetches not yet started are dropped, rather than waited for on exit
+            et.close()
+            released.set()
+            et._prefetcher.shutdown(wait=True)
+            assert mock_get.call_count < LilaTablebase.MAX_PREFETCHED_REPLIES
+
+    def test_lila_retries_after_failure(self):
+        board = BoardPyChess()
+        board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+        et = LilaTablebase()
+        response = mock.Mock()
+        response.json.return_value = {"dtz": 1, "moves": [{"uci": "d2c3"}]}
+        failures = LilaTablebase.MAX_CONSECUTIVE_FAILURES + 1
+        with mock.patch.object(
+            et._session, "get", side_effect=requests.exceptions.ConnectionError
+        ) as get, mock.patch("time.monotonic", return_value=1000.0) as monotonic:
+            for _ in range(failures):
+                assert et.query(board) is None
+            # The service is skipped after too many failures in a row
+            assert et.query(board) is None
+            assert get.call_count == failures
+            # And tried again once the disabled period has passed
+            monotonic.return_value += LilaTablebase.DISABLED_SECONDS
+            get.side_effect = None
+            get.return_value = response
+            assert et.query(board) == chess.Move.from_uci("d2c3")
+            assert et._failures == 0
+
 
 class TestCompositeTablebase:
     def test_composite_bestmove_empty(self):
@@ -1,4 +1,5 @@
 import time
+from unittest import mock
 
 from sporkfish import engine, opening_book
 from sporkfish.board.board_factory import BoardFactory, BoardPyChess
@@ -25,3 +26,12 @@ def test_timeout() -> None:
     _ = eng.score(board, 1e-3)
     # Timed out, impossible that depth 100 is <1 sec
     assert time.time() - start < 1
+
+
+def test_best_move_prefetches() -> None:
+    board = BoardFactory.create(BoardPyChess)
+    board.set_fen("8/4k3/8/8/8/8/3BB3/3K4 w - - 0 1")
+    eng = create_engine(1)
+    with mock.patch.object(eng._endgame_tablebase, "prefetch") as prefetch:
+        move = eng.best_move(board)
+    prefetch.assert_called_once_with(board, move)
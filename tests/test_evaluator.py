@@ -1,9 +1,10 @@
+import pytest
 from init_board_helper import board_setup, score_fen
 
 from sporkfish.evaluator.evaluator import Evaluator
 from sporkfish.evaluator.evaluator_config import EvaluatorConfig, EvaluatorMode
 from sporkfish.evaluator.evaluator_factory import EvaluatorFactory
-from sporkfish.evaluator.pesto import Pesto
+from sporkfish.evaluator.pesto import Pesto, _unpack
 
 
 def _evaluator(
@@ -121,12 +122,21 @@ class TestEvaluator:
 
         assert score == expected
 
+    def test_unpack(self) -> None:
+        for mg_score in (-30000, -1, 0, 1, 40000):
+            for eg_score in (-32768, -5, 0, 7, 32767):
+                assert _unpack(mg_score * (1 << 16) + eg_score) == (mg_score, eg_score)
+
 
 class TestEvaluatorFactory:
     def test_create_default(self) -> None:
         evaluator = EvaluatorFactory.create(EvaluatorConfig())
         assert isinstance(evaluator, Pesto)
 
+    def test_create_unsupported(self) -> None:
+        with pytest.raises(TypeError):
+            EvaluatorFactory.create(EvaluatorConfig(EvaluatorMode.SIMPLE))
+
 
 class TestScore:
     # NB: static evaluation function must return a score relative to the side to being evaluated, e.g. the simplest score evaluation could be:
@@ -1,5 +1,6 @@
 import multiprocessing
 import sys
+import threading
 import time
 import unittest.mock as mock
 
@@ -182,3 +183,83 @@ class TestLichessBot:
             sporkfish.client.bots.abort_game(challenge_event["challenge"]["id"])
         except RetryError:
             pass
+
+    def test_decline_challenge_during_game(self):
+        bot = lichess_bot_berserk.LichessBotBerserk("token")
+        game_over = threading.Event()
+        challenge_event = {
+            "challenge": {
+                "id": "challenge",
+                "variant": {"key": "standard"},
+                "speed": "blitz",
+            }
+        }
+
+        def play_game(game_id):
+            game_over.wait()
+            return GameTerminationReason.RESIGNATION
+
+        with mock.patch.object(
+            bot, "_play_game", side_effect=play_game
+        ), mock.patch.object(bot.client.bots, "decline_challenge") as mock_decline:
+            game = bot._event_action_start_game({"game": {"fullId": "game"}})
+            assert bot._game_in_progress()
+            assert not bot._event_action_accept_challenge(challenge_event)
+            mock_decline.assert_called_once_with("challenge")
+            game_over.set()
+            assert game.result(timeout=10) == GameTerminationReason.RESIGNATION
+            assert not bot._game_in_progress()
+
+    def test_decline_challenge_before_game_start(self):
+        bot = lichess_bot_berserk.LichessBotBerserk("token")
+
+        def challenge_event(challenge_id):
+            return {
+                "challenge": {
+                    "id": challenge_id,
+                    "variant": {"key": "standard"},
+                    "speed": "blitz",
+                }
+            }
+
+        with mock.patch.object(bot.client.bots, "accept_challenge"), mock.patch.object(
+            bot.client.bots, "decline_challenge"
+        ) as mock_decline:
+            assert bot._event_action_accept_challenge(challenge_event("first"))
+            # The first game has not started yet
+            assert not bot._event_action_accept_challenge(challenge_event("second"))
+            mock_decline.assert_called_once_with("second")
+            # Until the accepted challenge is canceled
+            bot._event_action_challenge_withdrawn(challenge_event("second"))
+            assert bot._game_in_progress()
+            bot._event_action_challenge_withdrawn(challenge_event("first"))
+            assert not bot._game_in_progress()
+            assert bot._event_action_accept_challenge(challenge_event("third"))
+
+    def test_run_again(self):
+        bot = lichess_bot_berserk.LichessBotBerserk("token")
+        game_event = {"type": "gameStart", "game": {"fullId": "game"}}
+        with mock.patch.object(
+            bot.client.bots, "stream_incoming_events", return_value=[game_event]
+        ), mock.patch.object(
+            bot, "_play_game", return_value=GameTerminationReason.RESIGNATION
+        ) as mock_play:
+            bot.run()
+            bot.run()
+        assert mock_play.call_count == 2
+
+    def test_set_position(self):
+        bot = lichess_bot_berserk.LichessBotBerserk("token")
+        with mock.patch.object(bot._sporkfish, "send_command") as mock_send:
+            bot._set_position("")
+            mock_send.assert_called_with("position startpos")
+            bot._set_position("e2e4 e7e5")
+            mock_send.assert_called_with("position startpos moves e2e4 e7e5")
+
+    def test_get_best_move(self):
+        bot = lichess_bot_berserk.LichessBotBerserk("token")
+        with mock.patch.object(
+            bot._sporkfish, "send_command", return_value="bestmove e7e5"
+        ) as mock_send:
+            assert bot._get_best_move(1, 59.9995, 2.0) == "e7e5"
+            mock_send.assert_called_once_with("go btime 60000 binc 2000")
@@ -42,6 +42,23 @@ class TestMvvLvaHeuristic:
             assert score == move_scores[num_moves - i - 1]
 
 
+@pytest.mark.parametrize(
+    ("fen_string"),
+    [
+        (board_setup["white"]["can_capture_queen"]),
+        (board_setup["white"]["mid"]),
+        (board_setup["black"]["mid"]),
+        ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 2"),
+    ],
+)
+def test_staged_ordering_matches_full_sort(fen_string: str) -> None:
+    board = init_board(fen_string)
+    mo_heuristic = MvvLvaHeuristic(board)
+    assert list(MoveOrderer.order_moves_staged(mo_heuristic, board)) == list(
+        MoveOrderer.order_moves(mo_heuristic, board.legal_moves)
+    )
+
+
 class TestKillerMoveHeuristic:
     def test_ordered_moves_end_game(self) -> None:
         board = init_board(board_setup["white"]["king_queen_fork"])
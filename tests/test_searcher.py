@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from init_board_helper import (
     board_setup,
@@ -300,3 +302,100 @@ class TestPVS:
             result_nega = s_nega._negamax(board, depth, alpha, beta, None)
             result_pvs = s_pvs._pvs(board, depth, alpha, beta, None)
             assert result_pvs == result_nega
+
+
+class TestStop:
+    def test_stop_after_first_depth(self, init_searcher: Searcher) -> None:
+        """
+        Stopping mid-search returns the move from the last completed depth
+        """
+        s = init_searcher
+        depths = []
+        search_depth = s._aspiration_windows_search
+
+        def stopping_search(board, depth, prev_score):
+            depths.append(depth)
+            s.stop()
+            return search_depth(board, depth, prev_score)
+
+        s._aspiration_windows_search = stopping_search
+        board = init_board(board_setup["white"]["mid"])
+        _, move = s.search(board)
+        assert depths == [1]
+        assert move in board.legal_moves
+
+    def test_stop_before_search(self, init_searcher: Searcher) -> None:
+        """
+        A stop requested before the search starts is honoured once the first depth completes
+        """
+        s = init_searcher
+        depths = []
+        search_depth = s._aspiration_windows_search
+
+        def recording_search(board, depth, prev_score):
+            depths.append(depth)
+            return search_depth(board, depth, prev_score)
+
+        s._aspiration_windows_search = recording_search
+        s.stop()
+        board = init_board(board_setup["white"]["mid"])
+        _, move = s.search(board)
+        assert depths == [1]
+        assert move in board.legal_moves
+
+        # Until the stop is withdrawn for the next search
+        depths.clear()
+        s.reset_stop()
+        s.search(board)
+        assert depths == [1, 2, 3, 4]
+
+    def test_stop_during_depth(self, init_searcher: Searcher) -> None:
+        """
+        Stopping mid-depth abandons that depth, returning the move from the last completed depth
+        """
+        s = init_searcher
+        completed = {}
+        search_depth = s._aspiration_windows_search
+
+        def stopping_search(board, depth, prev_score):
+            if depth == 3:
+                s.stop()
+            completed[depth] = search_depth(board, depth, prev_score)
+            return completed[depth]
+
+        s._aspiration_windows_search = stopping_search
+        board = init_board(board_setup["white"]["mid"])
+        result = s.search(board)
+        assert list(completed) == [1, 2]
+        assert result == completed[2]
+
+
+class TestLazySmp:
+    def test_depth_offsets_within_max_depth(self) -> None:
+        """
+        Processes searching deeper than the iteration never search past max depth
+        """
+        s = SearcherFactory.create(
+            SearcherConfig(
+                max_depth=4,
+                search_mode=SearchMode.NEGAMAX_LAZY_SMP,
+                move_order_config=MoveOrderConfig(
+                    move_order_mode=MoveOrderMode.COMPOSITE
+                ),
+            ),
+            evaluator=evaluator(),
+        )
+        s._num_processes = len(s._DEPTH_OFFSETS)
+        board = init_board(board_setup["white"]["two_kings"])
+        depths = []
+
+        def apipe(task, board, depth):
+            depths.append(depth)
+            future = mock.Mock()
+            future.get.return_value = task(board, depth)
+            return future
+
+        with mock.patch.object(s._pool, "apipe", apipe):
+            _, move = s._start_search_from_root(board, 3, -float("inf"), float("inf"))
+        assert depths == [3, 4, 4, 4]
+        assert move in board.legal_moves
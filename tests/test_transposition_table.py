@@ -0,0 +1,26 @@
+from sporkfish.transposition_table import Bound, TranspositionTable
+
+
+class TestTranspositionTable:
+    def test_exact_entry(self):
+        tt = TranspositionTable(dict())
+        tt.store(1, 2, 5.0)
+        assert tt.probe(1, 2)["score"] == 5.0
+        assert tt.probe(1, 1)["score"] == 5.0
+        assert tt.probe(1, 3) is None
+        assert tt.probe(2, 0) is None
+
+    def test_bound_entries(self):
+        tt = TranspositionTable(dict())
+        tt.store(1, 2, 5.0, Bound.LOWER)
+        assert tt.probe(1, 2, 0.0, 4.0)["score"] == 5.0
+        assert tt.probe(1, 2, 0.0, 6.0) is None
+
+        tt.store(2, 2, 5.0, Bound.UPPER)
+        assert tt.probe(2, 2, 6.0, 10.0)["score"] == 5.0
+        assert tt.probe(2, 2, 4.0, 10.0) is None
+
+    def test_bound(self):
+        assert TranspositionTable.bound(1.0, 1.0, 3.0) is Bound.UPPER
+        assert TranspositionTable.bound(2.0, 1.0, 3.0) is Bound.EXACT
+        assert TranspositionTable.bound(3.0, 1.0, 3.0) is Bound.LOWER
@@ -1,3 +1,4 @@
+import chess
 import pytest
 
 import sporkfish.uci_client as uci_client
@@ -22,3 +23,57 @@ def test_uci_client_time_inc(init_client):
     client = init_client
     response = client.send_command("go wtime 1 winc 0")
     assert "bestmove" in response
+
+
+def test_uci_client_position(init_client):
+    client = init_client
+    assert client.send_command("isready") == "readyok"
+    assert client.send_command("  position  startpos moves e2e4   e7e5 ") == ""
+    assert client.board.fen() == (
+        "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2"
+    )
+    assert client.send_command("") == ""
+    assert client.send_command("ucinewgame") == ""
+
+
+def test_uci_client_print(capsys):
+    client = uci_client.UCIClient(uci_client.UCIClient.UCIProtocol.ResponseMode.PRINT)
+    client.send_command("isready")
+    assert capsys.readouterr().out == "readyok\n"
+    client.send_command("position startpos moves e2e4")
+    assert capsys.readouterr().out == ""
+
+
+def test_uci_client_position_incremental(init_client):
+    client = init_client
+    client.send_command("position startpos moves e2e4")
+    response = client.send_command("go")
+    reply = response.split()[1]
+    first_move = client.board.board.move_stack[0]
+    client.send_command(f"position startpos moves e2e4 {reply} d2d4")
+    # Only the new move was pushed, onto the current board
+    assert client.board.board.move_stack[0] is first_move
+    expected = chess.Board()
+    for move in ("e2e4", reply, "d2d4"):
+        expected.push_uci(move)
+    assert client.board.fen() == expected.fen()
+    # A different game replays from the start
+    client.send_command("position startpos moves d2d4")
+    assert (
+        client.board.fen()
+        == chess.Board(
+            "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq - 0 1"
+        ).fen()
+    )
+
+
+def test_uci_client_ucinewgame(init_client):
+    client = init_client
+    client.send_command("position startpos moves e2e4")
+    client.send_command("go")
+    assert client.send_command("ucinewgame") == ""
+    assert client.engine._searcher._dict == {}
+    assert client.board.fen() == chess.Board().fen()
+    # The next game is replayed from the start
+    client.send_command("position startpos moves d2d4")
+    assert client.board.board.move_stack == [chess.Move.from_uci("d2d4")]
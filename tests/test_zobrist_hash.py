@@ -138,3 +138,43 @@ class TestZobristHashIncremental:
             captured_piece,
         ).zobrist_hash
         assert hash == inc_hash, f"{test_name} failed for move {move}"
+
+
+class TestZobristHashBoard:
+    """
+    Consistency test of the hash maintained by the board against the full hash
+    """
+
+    @pytest.mark.parametrize(
+        "fen",
+        [
+            chess.STARTING_FEN,
+            # Castling both ways, en passant and promotions available
+            "r3k2r/pPppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+            "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+            "rnbqkbnr/ppppp2p/6p1/4Pp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 1",
+        ],
+    )
+    def test_board_hash_consistency(self, fen):
+        zh = ZobristHasher()
+        board = BoardFactory.create(BoardPyChess)
+        board.set_fen(fen)
+        root_hash = board.zobrist_hash
+        assert root_hash == zh.full_zobrist_hash(board).zobrist_hash
+
+        for move in board.legal_moves:
+            board.push(move)
+            assert (
+                board.zobrist_hash == zh.full_zobrist_hash(board).zobrist_hash
+            ), f"Board hash consistency failed for move {move}"
+            for reply in board.legal_moves:
+                board.push(reply)
+                assert (
+                    board.zobrist_hash == zh.full_zobrist_hash(board).zobrist_hash
+                ), f"Board hash consistency failed for moves {move} {reply}"
+                board.pop()
+            board.push(chess.Move.null())
+            assert board.zobrist_hash == zh.full_zobrist_hash(board).zobrist_hash
+            board.pop()
+            board.pop()
+            assert board.zobrist_hash == root_hash